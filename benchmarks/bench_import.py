@@ -0,0 +1,15 @@
+"""Benchmarks for the time it takes to import Pastas."""
+
+
+class TimeImport:
+    timeout = 60
+
+    def timeraw_import_pastas(self):
+        # Run in a new interpreter, so no module is imported already
+        return "import pastas"
+
+    def timeraw_import_pastas_model(self):
+        return """
+        import pastas as ps
+        ps.Model
+        """
@@ -0,0 +1,70 @@
+"""Benchmarks for writing and reading Pastas files."""
+
+import os
+import shutil
+import tempfile
+
+import pastas as ps
+
+from .common import make_head, make_model, make_stresses
+
+
+class TimeIO:
+    params = ([365 * 10, 365 * 40], [".pas", ".pas.gz", ".npz"])
+    param_names = ["n", "ext"]
+
+    def setup(self, n, ext):
+        self.tmpdir = tempfile.mkdtemp()
+        self.ml = make_model(n)
+        self.ml.initialize()
+        self.fname = os.path.join(self.tmpdir, "model" + ext)
+        self.ml.dump(self.fname)
+
+    def teardown(self, n, ext):
+        shutil.rmtree(self.tmpdir)
+
+    def time_dump(self, n, ext):
+        self.ml.dump(self.fname)
+
+    def time_load(self, n, ext):
+        ps.io.load(self.fname)
+
+
+class TimeProjectIO:
+    params = ([100], [".pas", ".npz"])
+    param_names = ["n_models", "ext"]
+    timeout = 300
+
+    def setup(self, n_models, ext):
+        self.tmpdir = tempfile.mkdtemp()
+        prec, evap = make_stresses(365 * 20)
+        mls = ps.Project(name="bench")
+        mls.add_series(prec, name="prec", kind="prec")
+        mls.add_series(evap, name="evap", kind="evap")
+        for i in range(n_models):
+            name = "head%d" % i
+            mls.add_series(make_head(365 * 20, seed=i), name=name,
+                           kind="oseries")
+            ml = mls.add_model(name, log_level="ERROR")
+            sm = ps.StressModel2([mls.stresses.loc["prec", "series"],
+                                  mls.stresses.loc["evap", "series"]],
+                                 ps.Exponential, name="recharge")
+            ml.add_stressmodel(sm)
+        self.mls = mls
+        self.fname = os.path.join(self.tmpdir, "project" + ext)
+        mls.dump(self.fname)
+
+    def teardown(self, n_models, ext):
+        shutil.rmtree(self.tmpdir)
+
+    def time_dump(self, n_models, ext):
+        self.mls.dump(self.fname)
+
+    def time_load(self, n_models, ext):
+        ps.io.load(self.fname)
+
+    def time_load_lazy(self, n_models, ext):
+        ps.io.load(self.fname, lazy=True)
+
+    def time_load_parallel(self, n_models, ext):
+        ps.io.load(self.fname, n_jobs=-1)
@@ -0,0 +1,93 @@
+"""Benchmarks for the simulation and solve hot paths of the Model class."""
+
+import pickle
+
+import pastas as ps
+
+from .common import make_model, make_stresses, make_head
+
+
+class TimeSimulate:
+    params = [365 * 10, 365 * 40]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.ml = make_model(n)
+        self.ml.initialize()
+        self.p = self.ml.get_parameters()
+
+    def time_simulate(self, n):
+        self.ml.simulate(self.p)
+
+    def time_simulate_chunks(self, n):
+        for _ in self.ml.simulate_chunks(self.p, chunksize=365):
+            pass
+
+    def time_get_contributions(self, n):
+        self.ml.get_contributions(self.p)
+
+    def time_get_parameters_name(self, n):
+        self.ml.get_parameters("recharge")
+
+
+class TimeCreate:
+    params = [365 * 10]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.prec, self.evap = make_stresses(n)
+        self.head = make_head(n)
+        self.ml = make_model(n)
+
+    def time_create_model(self, n):
+        ml = ps.Model(self.head, log_level="ERROR")
+        sm = ps.StressModel2([self.prec, self.evap], ps.Exponential,
+                             name="recharge")
+        ml.add_stressmodel(sm)
+
+    def time_get_init_parameters(self, n):
+        self.ml.get_init_parameters()
+
+    def time_clone(self, n):
+        self.ml.clone()
+
+    def time_pickle(self, n):
+        pickle.loads(pickle.dumps(self.ml, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class TimeResiduals:
+    params = ([365 * 10, 365 * 40], [1, 14])
+    param_names = ["n", "obs_step"]
+
+    def setup(self, n, obs_step):
+        self.ml = make_model(n, obs_step=obs_step)
+        self.ml.initialize()
+        self.p = self.ml.get_parameters()
+
+    def time_residuals(self, n, obs_step):
+        self.ml.residuals(self.p)
+
+    def time_noise(self, n, obs_step):
+        self.ml.noise(self.p)
+
+
+class TimeSolve:
+    # DESolve is not benchmarked, it does not run under Python 3.
+    params = ([365 * 10], [1, 14], ["LeastSquares", "LmfitSolve"])
+    param_names = ["n", "obs_step", "solver"]
+    timeout = 120
+
+    def setup(self, n, obs_step, solver):
+        if solver == "LmfitSolve":
+            try:
+                import lmfit
+            except ImportError:
+                raise NotImplementedError("lmfit is not installed")
+        self.ml = make_model(n, obs_step=obs_step)
+        self.solver = getattr(ps, solver)
+
+    def time_solve(self, n, obs_step, solver):
+        self.ml.solve(solver=self.solver, report=False)
+
+    def time_solve_noise_false(self, n, obs_step, solver):
+        self.ml.solve(solver=self.solver, noise=False, report=False)
@@ -0,0 +1,111 @@
+"""Benchmarks for the readers of the files with time series."""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import pastas as ps
+from pastas.utils import datetime2matlab
+
+data_path = os.path.join(os.path.dirname(__file__), "..", "tests", "data")
+
+
+class TimeReadDino:
+    params = [1, 100]
+    param_names = ["n_files"]
+
+    def setup(self, n_files):
+        self.path = tempfile.mkdtemp()
+        for i in range(n_files):
+            shutil.copy(os.path.join(data_path, "dino_gwl_data.csv"),
+                        os.path.join(self.path, "dino%s.csv" % i))
+
+    def teardown(self, n_files):
+        shutil.rmtree(self.path)
+
+    def time_read_dino_dir(self, n_files):
+        ps.read_dino_dir(self.path)
+
+
+class TimeReadKnmi:
+    params = [1, 20]
+    param_names = ["n_stations"]
+
+    def setup(self, n_stations):
+        # A file with n_stations copies of the same rainfall station
+        with open(os.path.join(data_path, "knmi_rain_data.txt")) as f:
+            lines = f.readlines()
+        i = lines.index("STN,YYYYMMDD,   RD,   SX,\n") + 1
+        self.fname = tempfile.mktemp(suffix=".txt")
+        with open(self.fname, "w") as f:
+            f.writelines(lines[:i])
+            for stn in range(n_stations):
+                f.writelines("%s%s" % (stn, line[3:]) for line in lines[i:])
+
+        # Fill the cache, so time_read_knmi_cached loads from the cache
+        self.cache = tempfile.mkdtemp()
+        ps.read.set_cache(self.cache)
+        ps.read_knmi(self.fname, variables="RD")
+
+    def teardown(self, n_stations):
+        os.remove(self.fname)
+        ps.read.set_cache(None)
+        shutil.rmtree(self.cache)
+
+    def time_read_knmi(self, n_stations):
+        ps.read.KnmiStation.fromfile(self.fname)
+
+    def time_read_knmi_cached(self, n_stations):
+        ps.read_knmi(self.fname, variables="RD")
+
+    def time_read_knmi_variable(self, n_stations):
+        ps.read.KnmiStation.fromfile(self.fname, variables=["RD"])
+
+
+class TimeReadMeny:
+    params = [None, ["H1"]]
+    param_names = ["locations"]
+
+    def setup(self, locations):
+        from scipy.io import savemat
+        index = pd.date_range("1980-01-01", periods=10000, freq="D")
+        values = np.column_stack([datetime2matlab(index), np.ones(10000)])
+        H = np.empty(100, dtype=object)
+        for i in range(H.size):
+            H[i] = {"Name": "H%s" % i, "values": values, "xcoord": 0.0,
+                    "ycoord": 0.0, "upfiltlev": 0.0, "lowfiltlev": 0.0}
+        self.fname = tempfile.mktemp(suffix=".men")
+        savemat(self.fname, {"H": H, "IN": H})
+
+    def teardown(self, locations):
+        os.remove(self.fname)
+
+    def time_read_meny(self, locations):
+        ps.read.MenyData(self.fname, data="H", locations=locations)
+
+
+class TimeReadWaterbase:
+    params = [10, 200]
+    param_names = ["n_locations"]
+
+    def setup(self, n_locations):
+        index = pd.date_range("2018-01-01", periods=2000, freq="10min")
+        dates = index.strftime("%d-%m-%Y")
+        times = index.strftime("%H:%M:%S")
+        self.fname = tempfile.mktemp(suffix=".csv")
+        with open(self.fname, "w") as f:
+            f.write("MEETPUNT_IDENTIFICATIE;WAARNEMINGDATUM;WAARNEMINGTIJD;"
+                    "NUMERIEKEWAARDE;EPSG;X;Y\n")
+            for date, time in zip(dates, times):
+                for i in range(n_locations):
+                    f.write("loc%s;%s;%s;%s;25831;624112,29;5878437,18\n" %
+                            (i, date, time, i))
+
+    def teardown(self, n_locations):
+        os.remove(self.fname)
+
+    def time_read_waterbase(self, n_locations):
+        ps.read_waterbase(self.fname)
@@ -0,0 +1,16 @@
+"""Benchmarks for the computation of the block responses."""
+
+import pastas as ps
+
+
+class TimeBlock:
+    params = (["Gamma", "Exponential", "Hantush", "Theis", "Bruggeman"],
+              [0.99, 0.999])
+    param_names = ["rfunc", "cutoff"]
+
+    def setup(self, rfunc, cutoff):
+        self.rfunc = getattr(ps.rfunc, rfunc)(meanstress=1, cutoff=cutoff)
+        self.p = self.rfunc.set_parameters("bench").initial.values
+
+    def time_block(self, rfunc, cutoff):
+        self.rfunc.block(self.p, cutoff=cutoff)
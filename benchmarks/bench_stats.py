@@ -0,0 +1,41 @@
+"""Benchmarks for the statistics of time series."""
+
+import pastas as ps
+
+from .common import make_head
+
+
+class TimeCorrelation:
+    params = ([365 * 2, 365 * 10], [1, 14])
+    param_names = ["n", "obs_step"]
+
+    def setup(self, n, obs_step):
+        self.x = make_head(n, obs_step=obs_step, seed=0)
+        self.y = make_head(n, obs_step=obs_step, seed=1)
+        self.lags = [1, 7, 14, 30, 60, 90, 180, 365]
+
+    def time_acf(self, n, obs_step):
+        ps.stats.acf(self.x, lags=self.lags)
+
+    def time_ccf(self, n, obs_step):
+        ps.stats.ccf(self.x, self.y, lags=self.lags)
+
+
+class TimeGXG:
+    params = ([365 * 10, 365 * 40], [1, 14])
+    param_names = ["n", "obs_step"]
+
+    def setup(self, n, obs_step):
+        self.series = make_head(n, obs_step=obs_step)
+
+    def time_ghg(self, n, obs_step):
+        ps.stats.ghg(self.series)
+
+    def time_glg(self, n, obs_step):
+        ps.stats.glg(self.series)
+
+    def time_gvg(self, n, obs_step):
+        ps.stats.gvg(self.series)
+
+    def time_q_ghg(self, n, obs_step):
+        ps.stats.q_ghg(self.series)
@@ -0,0 +1,33 @@
+"""Benchmarks for the simulation of the stressmodels."""
+
+import pastas as ps
+
+from .common import make_stresses
+
+
+class TimeStressModel:
+    params = [365 * 10, 365 * 40]
+    param_names = ["n"]
+
+    def setup(self, n):
+        prec, evap = make_stresses(n)
+        self.sm = ps.StressModel(prec - evap, ps.Gamma, name="recharge")
+        self.p = self.sm.parameters.initial.values
+
+    def time_simulate(self, n):
+        self.sm.simulate(self.p)
+
+
+class TimeStressModel2:
+    # The WellModel is not benchmarked, its simulate method does not run on
+    # the TimeSeries it stores.
+    params = [365 * 10, 365 * 40]
+    param_names = ["n"]
+
+    def setup(self, n):
+        prec, evap = make_stresses(n)
+        self.sm = ps.StressModel2([prec, evap], ps.Gamma, name="recharge")
+        self.p = self.sm.parameters.initial.values
+
+    def time_simulate(self, n):
+        self.sm.simulate(self.p)
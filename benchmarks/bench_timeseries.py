@@ -0,0 +1,63 @@
+"""Benchmarks for the TimeSeries class and the resampling of series."""
+
+import numpy as np
+import pandas as pd
+
+import pastas as ps
+from pastas.utils import timestep_weighted_resample
+
+from .common import make_index, make_stresses
+
+
+class TimeUpdateSeries:
+    params = [365 * 10, 365 * 40]
+    param_names = ["n"]
+
+    def setup(self, n):
+        prec, _ = make_stresses(n)
+        self.prec = prec
+        self.ts = ps.TimeSeries(prec, freq="D", settings="prec")
+        self.ts.clear_cache()
+
+    def _update(self, **kwargs):
+        # Clear the cache so every call recomputes the series
+        self.ts.clear_cache()
+        self.ts.update_series(force_update=True, **kwargs)
+
+    def time_validate(self, n):
+        ps.TimeSeries(self.prec, settings="prec")
+
+    def time_sample_down(self, n):
+        self._update(freq="7D")
+
+    def time_sample_up(self, n):
+        self._update(freq="H")
+
+    def time_fill_before(self, n):
+        self._update(tmin=self.prec.index[0] - pd.Timedelta(days=n),
+                     fill_before="mean")
+
+    def time_fill_after(self, n):
+        self._update(tmax=self.prec.index[-1] + pd.Timedelta(days=n),
+                     fill_after="mean")
+
+    def time_normalize(self, n):
+        self._update(norm="mean")
+
+    def time_cache_hit(self, n):
+        self.ts.update_series(freq="7D")
+        self.ts.update_series(freq="D")
+
+
+class TimeWeightedResample:
+    params = [365 * 2, 365 * 10]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.RandomState(0)
+        index = make_index(n)
+        self.series = pd.Series(rng.normal(size=n), index=index)
+        self.tindex = make_index(n // 7, freq="7D")
+
+    def time_timestep_weighted_resample(self, n):
+        timestep_weighted_resample(self.series, self.tindex)
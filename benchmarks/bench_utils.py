@@ -0,0 +1,49 @@
+"""Benchmarks for the convolution methods and the date conversions.
+
+The crossover points in pastas.utils that are used to select the
+convolution method with method="auto" are measured with these benchmarks.
+
+"""
+
+import numpy as np
+from pandas import date_range
+
+from pastas.utils import convolve, datetime2matlab, matlab2datetime
+
+
+class TimeConvolve:
+    params = ([1000, 20000, 500000], [16, 128, 1024, 8192],
+              ["exponential", "gamma"],
+              ["direct", "fft", "overlap", "recursive", "auto"])
+    param_names = ["n", "m", "block", "method"]
+    timeout = 120
+
+    def setup(self, n, m, block, method):
+        if block == "gamma" and method == "recursive":
+            raise NotImplementedError("recursive needs a geometric block")
+        rng = np.random.RandomState(0)
+        self.x = rng.gamma(0.4, 5, n) / 1000
+        # Block responses of m values that decay to ~0.1% of the maximum
+        t = np.arange(m + 1) * 7.0 / m
+        if block == "exponential":
+            self.b = np.diff(1 - np.exp(-t))
+        else:
+            self.b = np.diff(1 - np.exp(-t) * (1 + t))
+
+    def time_convolve(self, n, m, block, method):
+        convolve(self.x, self.b, method=method)
+
+
+class TimeMatlabDates:
+    params = [1000, 100000]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.index = date_range("1980-01-01", periods=n, freq="H")
+        self.datenums = datetime2matlab(self.index)
+
+    def time_datetime2matlab(self, n):
+        datetime2matlab(self.index)
+
+    def time_matlab2datetime(self, n):
+        matlab2datetime(self.datenums)
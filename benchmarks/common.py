@@ -0,0 +1,49 @@
+"""Synthetic datasets for the Pastas benchmarks.
+
+All datasets are generated from a fixed random seed, so the length and
+sampling of the series are the only things that change between runs.
+
+"""
+
+import numpy as np
+import pandas as pd
+
+import pastas as ps
+
+
+def make_index(n, freq="D", tmin="1980-01-01"):
+    """Return a DatetimeIndex with n timesteps of frequency freq."""
+    return pd.date_range(tmin, periods=n, freq=freq)
+
+
+def make_stresses(n, freq="D", seed=0):
+    """Return a precipitation and evaporation series of length n in m/d."""
+    rng = np.random.RandomState(seed)
+    index = make_index(n, freq)
+    prec = pd.Series(rng.gamma(0.4, 5, n) / 1000, index=index, name="prec")
+    evap = pd.Series((1.5 + 1.2 * np.sin(np.arange(n) * 2 * np.pi / 365)) /
+                     1000, index=index, name="evap")
+    return prec, evap
+
+
+def make_head(n, freq="D", obs_step=14, seed=0):
+    """Return a synthetic head series of length n, sampled every obs_step
+    timesteps, as the response of the recharge to an exponential block
+    response.
+
+    """
+    rng = np.random.RandomState(seed)
+    prec, evap = make_stresses(n, freq, seed)
+    b = ps.Exponential().block([400, 80])
+    h = np.convolve(prec - evap, b)[:n] + 10 + rng.normal(0, 0.02, n)
+    return pd.Series(h, index=prec.index, name="head").iloc[::obs_step]
+
+
+def make_model(n, freq="D", obs_step=14, noise=True, seed=0):
+    """Return a Model with a StressModel2 for a dataset of length n."""
+    prec, evap = make_stresses(n, freq, seed)
+    head = make_head(n, freq, obs_step, seed)
+    ml = ps.Model(head, noisemodel=noise, log_level="ERROR")
+    sm = ps.StressModel2([prec, evap], ps.Exponential, name="recharge")
+    ml.add_stressmodel(sm)
+    return ml
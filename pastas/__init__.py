@@ -5,7 +5,8 @@ import pastas.stats
 from .model import Model
 from .noisemodels import NoiseModel, NoiseModel2
 from .project import Project
-from .read import read_meny, read_dino, read_knmi, read_waterbase
+from .read import read_meny, read_dino, read_dino_dir, read_knmi, \
+    read_waterbase
 from .rfunc import Gamma, Exponential, Hantush, Theis, Bruggeman, One
 from .solver import LmfitSolve, LeastSquares, DESolve
 from .stressmodels import StressModel, StressModel2, Constant
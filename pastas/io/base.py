@@ -3,14 +3,20 @@ Import model
 """
 
 from importlib import import_module
+from logging import getLogger
 from os import path
 
-from pandas import DataFrame, to_numeric
+from pandas import DataFrame, Series, to_numeric
 
 import pastas as ps
 
+logger = getLogger(__name__)
 
-def load(fname, **kwargs):
+# Extensions of the compressed files and the module to (de)compress them
+_compression = {".gz": "gzip", ".xz": "lzma", ".bz2": "bz2", ".zst": "zstd"}
+
+
+def load(fname, lazy=False, max_models=None, n_jobs=None, **kwargs):
     """Method to load models from file supported by the pastas library.
 
     Parameters
@@ -18,11 +24,21 @@ def load(fname, **kwargs):
     fname: str
         string with the name of the file to be imported including the file
         extension.
+    lazy: bool, optional
+        Only for projects: create the models when they are accessed for the
+        first time. Default is False.
+    max_models: int, optional
+        Only for projects loaded with lazy=True: the maximum number of models
+        that are kept in memory. Default is None (no maximum).
+    n_jobs: int, optional
+        Only for projects: the number of processes used to create the
+        models, -1 to use all processors. Default is None, in which case the
+        models are created in this process.
     kwargs: extension specific
 
     """
     # Dynamic import of the export module
-    ext = path.splitext(fname)[1]
+    ext = get_extension(fname)
     load_mod = import_module("pastas.io" + ext)
 
     # Get dicts for all data sources
@@ -30,7 +46,8 @@ def load(fname, **kwargs):
 
     # Determine whether it is a Pastas Project or a Pastas Model
     if "models" in data.keys():
-        ml = load_project(data)
+        ml = load_project(data, lazy=lazy, max_models=max_models,
+                          n_jobs=n_jobs)
         kind = "Project"
     else:
         ml = load_model(data)
@@ -44,13 +61,23 @@ def load(fname, **kwargs):
     return ml
 
 
-def load_project(data):
+def load_project(data, lazy=False, max_models=None, n_jobs=None):
     """Method to load a Pastas project.
 
     Parameters
     ----------
     data: dict
         Dictionary containing all information to construct the project.
+    lazy: bool, optional
+        Create the models when they are accessed for the first time instead
+        of when the project is loaded. Default is False.
+    max_models: int, optional
+        The maximum number of models that are kept in memory when lazy is
+        True. Default is None (no maximum).
+    n_jobs: int, optional
+        The number of processes used to create the models, -1 to use all
+        processors. Default is None, in which case the models are created in
+        this process.
 
     Returns
     -------
@@ -64,6 +91,16 @@ def load_project(data):
     mls.metadata = data["metadata"]
     mls.file_info = data["file_info"]
 
+    # Series that are stored once and referenced by the hash of their content
+    series_table = data.get("series_table", dict())
+
+    # Create the TimeSeries if the file format did not do so already
+    for series in list(data["oseries"].values()) + \
+            list(data["stresses"].values()):
+        if isinstance(series["series"], dict):
+            ts = _get_series(series["series"], series_table)
+            series["series"] = ps.TimeSeries(**ts)
+
     oseries = DataFrame(data["oseries"], columns=data["oseries"].keys()).T
     mls.oseries = mls.oseries.append(oseries)
 
@@ -71,28 +108,118 @@ def load_project(data):
                          columns=data["stresses"].keys()).T
     mls.stresses = mls.stresses.append(stresses)
 
-    for ml_name, ml in data["models"].items():
+    for ml in data["models"].values():
         name = str(ml["oseries"]["name"])
-        ml_name = str(ml_name)
-        ml["oseries"]["series"] = mls.oseries.loc[name, "series"]
+        _get_series(ml["oseries"], series_table,
+                    mls.oseries.loc[name, "series"])
         if ml["stressmodels"]:
             for ts in ml["stressmodels"].values():
-                for i, stress in enumerate(ts["stress"]):
-                    stress_name = stress["name"]
-                    ts["stress"][i]["series"] = mls.stresses.loc[
-                        stress_name, "series"]
-        try:
-            ml = load_model(ml)
-            mls.models[ml_name] = ml
-        except:
-            try:
-                mls.del_model(ml_name)
-            except:
-                pass
-            print("model", ml_name, "could not be added")
+                for stress in ts["stress"]:
+                    _get_series(stress, series_table,
+                                mls.stresses.loc[stress["name"], "series"])
+
+    if lazy:
+        mls.models = ps.project.lazy.LazyModels(data["models"],
+                                                max_models=max_models)
+        return mls
+
+    if n_jobs in (None, 1):
+        models = map(_load_model, data["models"].values())
+        _add_models(mls, data["models"], models)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from os import cpu_count
+        if n_jobs == -1:
+            n_jobs = cpu_count() or 1
+        chunksize = max(1, len(data["models"]) // (4 * n_jobs))
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            models = pool.map(_load_model, data["models"].values(),
+                              chunksize=chunksize)
+            _add_models(mls, data["models"], models, share_series=True)
+
     return mls
 
 
+def _add_models(mls, data, models, share_series=False):
+    """Internal method to add the models that are created from the data to
+    the project, or to log why a model could not be created.
+
+    """
+    for (ml_name, ml_data), ml in zip(data.items(), models):
+        ml_name = str(ml_name)
+        if isinstance(ml, Exception):
+            logger.error("Model %s could not be added: %s", ml_name, ml,
+                         exc_info=ml)
+            mls.del_model(ml_name)
+        else:
+            if share_series:
+                _share_series(ml, ml_data)
+            mls.models[ml_name] = ml
+
+
+def _load_model(data):
+    """Internal method to load a model, that returns the exception when the
+    model can not be created, so it can be reported by the main process.
+
+    """
+    try:
+        return load_model(data)
+    except Exception as e:
+        return e
+
+
+def _share_series(ml, data):
+    """Internal method to use the series in the data of a model for the
+    TimeSeries of a model that is created in another process, so the series
+    are shared with the other models again.
+
+    """
+    ts_list = [(ml.oseries, data["oseries"])]
+    for name, sm in ml.stressmodels.items():
+        ts_data = data["stressmodels"][name].get("stress", [])
+        ts_list.extend(zip(sm.stress, ts_data))
+
+    for ts, ts_data in ts_list:
+        series = ts_data.get("series")
+        if isinstance(series, Series) and \
+                ts.series_original.name == series.name:
+            if ts.series_validated is ts.series_original:
+                ts._series_validated = series
+            ts._series_original = series
+
+
+def _get_series(ts, series_table, default=None):
+    """Internal method to add the series to a dumped TimeSeries.
+
+    Parameters
+    ----------
+    ts: dict
+        Dictionary with the dumped TimeSeries, that is updated in place.
+    series_table: dict
+        Dictionary with the series, with the hash of their content as key.
+    default: pastas.TimeSeries, optional
+        TimeSeries of which the original series is used when the dumped
+        TimeSeries does not reference a series in the series table.
+
+    Returns
+    -------
+    ts: dict
+        Dictionary with the dumped TimeSeries, including the series.
+
+    Notes
+    -----
+    The same Series object is used for all TimeSeries that reference the
+    same series, so the series are not copied when they are valid.
+
+    """
+    if "series_hash" in ts:
+        ts["series"] = series_table[ts.pop("series_hash")]["series"]
+    elif default is not None:
+        ts["series"] = default.series_original
+        ts["validated"] = ps.TimeSeries._is_valid(ts["series"])
+    return ts
+
+
 def load_model(data):
     # Create model
     oseries = ps.TimeSeries(**data["oseries"])
@@ -122,7 +249,9 @@ def load_model(data):
     else:
         noise = False
 
-    ml = ps.Model(oseries, constant=constant, noisemodel=noise, name=name,
+    # The noisemodel is added below, so do not let the Model add one first
+    settings.setdefault("noise", noise)
+    ml = ps.Model(oseries, constant=constant, noisemodel=False, name=name,
                   metadata=metadata, settings=settings)
     if "file_info" in data.keys():
         ml.file_info.update(data["file_info"])
@@ -156,9 +285,15 @@ def load_model(data):
     ml.parameters.update(data["parameters"])
     ml.parameters = ml.parameters.apply(to_numeric, errors="ignore")
 
-    # When initial values changed
-    for param, value in ml.parameters.loc[:, "initial"].iteritems():
-        ml.set_initial(name=param, value=value)
+    # When initial values changed, set them for all components at once
+    components = list(ml.stressmodels.values()) + [ml.constant, ml.transform,
+                                                   ml.noisemodel]
+    for component in components:
+        if component is None:
+            continue
+        names = component.parameters.index.intersection(ml.parameters.index)
+        component.parameters.loc[names, "initial"] = \
+            ml.parameters.loc[names, "initial"]
 
     return ml
 
@@ -171,7 +306,9 @@ def dump(fname, data, **kwargs):
     ----------
     fname: str
         string with the name of the file, including a supported
-        file-extension. Currently supported extension are: .pas.
+        file-extension. Currently supported extension are: .pas and
+        .npz. A .pas file can be compressed by adding .gz, .xz, .bz2 or .zst
+        to the file name, e.g. "model.pas.gz".
     data: dict
         dictionary with the information to store.
     kwargs: extension specific keyword arguments can be provided using kwargs.
@@ -182,6 +319,67 @@ def dump(fname, data, **kwargs):
         Message if the file-saving was successful.
 
     """
-    ext = path.splitext(fname)[1]
+    ext = get_extension(fname)
     dump_mod = import_module("pastas.io" + ext)
     return dump_mod.dump(fname, data, **kwargs)
+
+
+def get_extension(fname):
+    """Method to get the extension of a file that determines the file
+    format, without the extension of the compression (e.g. ".pas" for
+    "model.pas.gz"). Raises a ValueError when a file with another format
+    than .pas has the extension of a compression.
+
+    """
+    root, ext = path.splitext(fname)
+    if ext in _compression:
+        ext = path.splitext(root)[1]
+        if ext != ".pas":
+            raise ValueError("Only .pas files can be compressed, not %s "
+                             "files." % ext)
+    return ext
+
+
+def get_compression(fname):
+    """Method to get the compression of a file from its extension. Returns
+    None for files that are not compressed.
+
+    """
+    return _compression.get(path.splitext(fname)[1])
+
+
+def open_file(fname, mode="r"):
+    """Method to open a file that is compressed with gzip (.gz), xz (.xz),
+    bzip2 (.bz2) or zstandard (.zst) as a stream, based on the extension.
+
+    Parameters
+    ----------
+    fname: str
+        String with the name of the file.
+    mode: str, optional
+        "r" (default) to read or "w" to write text.
+
+    Returns
+    -------
+    file: file object
+        file object that compresses or decompresses the text while it is
+        written or read.
+
+    Notes
+    -----
+    The zstandard package is needed for .zst files.
+
+    """
+    compression = get_compression(fname)
+    if compression is None:
+        return open(fname, mode)
+    elif compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("The zstandard package is needed to read or "
+                              "write .zst files.")
+        return zstandard.open(fname, mode + "t", encoding="utf-8")
+    else:
+        compression = import_module(compression)
+        return compression.open(fname, mode + "t", encoding="utf-8")
@@ -51,8 +51,7 @@ def dump(fname, data, version=3):
                        'datlog_serial']:
             Hdict[field] = ''
         elif field == 'values':
-            date = array(
-                [datetime2matlab(x) for x in data['oseries']['series'].index])
+            date = datetime2matlab(data['oseries']['series'].index)
             vals = data['oseries']['series'].values
             Hdict[field] = [vstack((date, vals)).transpose()]
         elif field == 'filtnr':
@@ -145,8 +144,7 @@ def dump(fname, data, version=3):
                 elif field in ['LoggerSerial', 'datlog_serial']:
                     INdict[field] = ''
                 elif field == 'values':
-                    date = array(
-                        [datetime2matlab(x) for x in stress['series'].index])
+                    date = datetime2matlab(stress['series'].index)
                     vals = stress['series'].values
                     INdict[field] = [vstack((date, vals)).transpose()]
                 elif field == 'filtnr':
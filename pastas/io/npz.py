@@ -0,0 +1,163 @@
+"""This file contains the import and export methods for npz-files.
+
+A .npz file is a binary alternative to the .pas file. It is a NumPy archive
+that stores all time series in three columnar arrays and all other
+information as a small JSON document:
+
+- index: the time stamps of all series in nanoseconds (int64),
+- values: the values of all series (float64),
+- offsets: the position of each series in the index and values arrays,
+- metadata: the JSON document (bytes), in which the series are replaced by
+  a reference to their position in the offsets array.
+
+A series that is used more than once, e.g. a precipitation series used by
+many models in a project, is stored only once.
+
+"""
+
+import json
+from collections import OrderedDict
+
+import numpy as np
+from pandas import NaT, Series, Timedelta, DataFrame, Timestamp, \
+    DatetimeIndex
+
+from pastas import TimeSeries
+
+
+def load(fname):
+    with np.load(fname, allow_pickle=False) as npz:
+        index = npz["index"]
+        values = npz["values"]
+        offsets = npz["offsets"]
+        metadata = npz["metadata"].tobytes().decode("utf-8")
+
+    decoder = PastasNpzDecoder(index, values, offsets)
+    data = json.loads(metadata, object_pairs_hook=decoder.hook)
+    return data
+
+
+def dump(fname, data, compress=False):
+    """Method to write the data to a .npz file.
+
+    Parameters
+    ----------
+    fname: str
+        String with the name of the file.
+    data: dict
+        Dictionary with the data to store.
+    compress: bool, optional
+        Compress the arrays in the file (slower, but smaller files).
+        Default is False.
+
+    """
+    with open(fname, "wb") as fo:
+        _write(fo, data, compress=compress)
+    return print("%s file succesfully exported" % fname)
+
+
+def _write(fo, data, compress=False):
+    """Internal method to write the data to an open file object in the .npz
+    format.
+
+    """
+    encoder = PastasNpzEncoder()
+    metadata = encoder.encode(data)
+    index, values, offsets = encoder.get_arrays()
+
+    metadata = np.frombuffer(metadata.encode("utf-8"), dtype=np.uint8)
+
+    save = np.savez_compressed if compress else np.savez
+    save(fo, index=index, values=values, offsets=offsets, metadata=metadata)
+
+
+class PastasNpzEncoder(json.JSONEncoder):
+    """Enhanced encoder that collects the series to store them in the columnar
+    arrays and replaces them by a reference in the JSON document.
+
+    Notes
+    -----
+    Series are identified by their id, so a series object that is used
+    more than once is stored only once.
+
+    """
+
+    def __init__(self, **kwargs):
+        json.JSONEncoder.__init__(self, **kwargs)
+        self.series = []
+        self.refs = dict()
+
+    def add_series(self, series):
+        key = id(series)
+        if key not in self.refs:
+            self.refs[key] = len(self.series)
+            self.series.append(series)
+        return {"__series__": self.refs[key], "name": series.name}
+
+    def get_arrays(self):
+        offsets = np.zeros(len(self.series) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([s.size for s in self.series])
+        if self.series:
+            index = np.concatenate([s.index.asi8 for s in self.series])
+            values = np.concatenate([s.values.astype(float) for s in
+                                     self.series])
+        else:
+            index = np.empty(0, dtype=np.int64)
+            values = np.empty(0, dtype=float)
+        return index, values, offsets
+
+    def default(self, obj):
+        if isinstance(obj, TimeSeries):
+            return self.add_series(obj.series)
+        elif isinstance(obj, Series):
+            return self.add_series(obj)
+        elif isinstance(obj, DataFrame):
+            # Store per column to maintain the order and the dtypes
+            columns = OrderedDict((col, obj[col].tolist()) for col in obj)
+            return {"__dataframe__": columns, "index": obj.index.tolist()}
+        elif obj is NaT:
+            return None
+        elif isinstance(obj, Timestamp):
+            return {"__timestamp__": obj.isoformat()}
+        elif isinstance(obj, Timedelta):
+            return {"__timedelta__": obj.value}
+        elif isinstance(obj, np.generic):
+            return obj.item()
+        else:
+            return super(PastasNpzEncoder, self).default(obj)
+
+
+class PastasNpzDecoder:
+    """Decoder that rebuilds the series from the columnar arrays.
+
+    Notes
+    -----
+    Every reference to the same series returns the same Series object.
+
+    """
+
+    def __init__(self, index, values, offsets):
+        self.index = index
+        self.values = values
+        self.offsets = offsets
+        self.series = dict()
+
+    def get_series(self, i, name=None):
+        if i not in self.series:
+            i0, i1 = self.offsets[i], self.offsets[i + 1]
+            index = DatetimeIndex(self.index[i0:i1])
+            self.series[i] = Series(self.values[i0:i1], index=index,
+                                    name=name)
+        return self.series[i]
+
+    def hook(self, pairs):
+        obj = OrderedDict(pairs)
+        if "__series__" in obj:
+            return self.get_series(obj["__series__"], obj["name"])
+        elif "__dataframe__" in obj:
+            return DataFrame(obj["__dataframe__"], index=obj["index"])
+        elif "__timestamp__" in obj:
+            return Timestamp(obj["__timestamp__"])
+        elif "__timedelta__" in obj:
+            return Timedelta(obj["__timedelta__"])
+        return obj
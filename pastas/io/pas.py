@@ -1,6 +1,7 @@
 """This file contains the import method for pas-files.
 
-Import a .pas file (basically a json format)
+Import a .pas file (basically a json format). The file is compressed when
+the file name ends with .gz, .xz, .bz2 or .zst (e.g. model.pas.gz).
 
 R.A. Collenteur - August 2017
 
@@ -13,10 +14,12 @@ from pandas import NaT, Series, Timedelta, DataFrame, read_json, Timestamp, \
     to_numeric
 
 from pastas import TimeSeries
+from .base import get_compression, open_file
 
 
 def load(fname):
-    data = json.load(open(fname), object_hook=pastas_hook)
+    with open_file(fname) as fi:
+        data = json.load(fi, object_hook=pastas_hook)
     return data
 
 
@@ -51,7 +54,10 @@ def pastas_hook(obj):
 
 
 def dump(fname, data):
-    json.dump(data, open(fname, 'w'), indent=4, cls=PastasEncoder)
+    # Compressed files are not indented, as no one reads them directly
+    indent = None if get_compression(fname) else 4
+    with open_file(fname, "w") as fo:
+        json.dump(data, fo, indent=indent, cls=PastasEncoder)
     return print("%s file succesfully exported" % fname)
 
 
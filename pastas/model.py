@@ -22,6 +22,7 @@ import pandas as pd
 from .decorators import get_stressmodel
 from .io.base import dump
 from .noisemodels import NoiseModel
+from .parameters import concat_parameters
 from .plots import Plotting
 from .solver import LeastSquares
 from .stats import Statistics
@@ -87,10 +88,9 @@ class Model:
                 name = 'Observations'
         self.name = str(name)
 
-        self.parameters = pd.DataFrame(
-            columns=["initial", "name", "optimal", "pmin", "pmax", "vary",
-                     "stderr"])
+        self.parameters = concat_parameters([])
         self.stressmodels = OrderedDict()
+        self._parameter_slices = OrderedDict()
         self.constant = None
         self.transform = None
         self.noisemodel = None
@@ -101,6 +101,7 @@ class Model:
             "tmax": None,
             "freq": "D",
             "warmup": 3650,
+            "warmup_mode": "simulate",
             "time_offset": pd.Timedelta(0),
             "noise": noisemodel,
             "solver": None,
@@ -121,6 +122,7 @@ class Model:
 
         # initialize some attributes for solving and simulation
         self.sim_index = None
+        self._sim_index_key = None
         self.oseries_calib = None
         self.interpolate_simulation = None
         self.normalize_residuals = False
@@ -142,6 +144,43 @@ class Model:
                                const=not self.constant is None,
                                noise=not self.noisemodel is None)
 
+    def __getstate__(self):
+        """Method to get the state of the model for pickling, e.g. to send
+        the model to another process.
+
+        Notes
+        -----
+        The logger, the stats and plots helpers and the series that are
+        derived from the oseries and the settings are left out. The helpers
+        are created again when the model is unpickled and the derived series
+        when they are needed.
+
+        """
+        state = self.__dict__.copy()
+        for key in ["logger", "stats", "plots", "plot"]:
+            state.pop(key, None)
+        for key in ["_odelt", "sim_index", "oseries_calib",
+                    "interpolate_simulation"]:
+            state[key] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.logger = getLogger(__name__)
+        self.stats = Statistics(self)
+        self.plots = Plotting(self)
+        self.plot = self.plots.plot
+
+    @property
+    def odelt(self):
+        if self._odelt is None:
+            self._odelt = self.get_odelt()
+        return self._odelt
+
+    @odelt.setter
+    def odelt(self, odelt):
+        self._odelt = odelt
+
     def add_stressmodel(self, stressmodel, replace=False):
         """Adds a stressmodel to the main model.
 
@@ -170,9 +209,15 @@ class Model:
             self.logger.error("The name for the stressmodel you are trying "
                               "to add already exists for this model. Select "
                               "another name.")
+        elif stressmodel.name in self._get_component_names("stressmodels"):
+            self.logger.error("The name for the stressmodel you are trying "
+                              "to add is used by the constant, transform or "
+                              "noisemodel of this model. Select another "
+                              "name.")
         else:
             self.stressmodels[stressmodel.name] = stressmodel
             self.parameters = self.get_init_parameters()
+            self._set_parameter_slices()
             if self.settings["freq"] is None:
                 self.set_freq()
             stressmodel.update_stress(freq=self.settings["freq"])
@@ -191,14 +236,26 @@ class Model:
         >>> ml.add_constant(d)
 
         """
+        if constant.name in self._get_component_names("constant"):
+            self.logger.error("The name for the constant you are trying to "
+                              "add is used by another component of this "
+                              "model. Select another name.")
+            return
         self.constant = constant
         self.parameters = self.get_init_parameters()
+        self._set_parameter_slices()
 
     def add_transform(self, transform):
         if isclass(transform):
             transform = transform(self)
+        if transform.name in self._get_component_names("transform"):
+            self.logger.error("The name for the transform you are trying to "
+                              "add is used by another component of this "
+                              "model. Select another name.")
+            return
         self.transform = transform
         self.parameters = self.get_init_parameters()
+        self._set_parameter_slices()
 
     def add_noisemodel(self, noisemodel):
         """Adds a noisemodel to the time series Model.
@@ -214,8 +271,14 @@ class Model:
         >>> ml.add_noisemodel(n)
 
         """
+        if noisemodel.name in self._get_component_names("noisemodel"):
+            self.logger.error("The name for the noisemodel you are trying to "
+                              "add is used by another component of this "
+                              "model. Select another name.")
+            return
         self.noisemodel = noisemodel
         self.parameters = self.get_init_parameters()
+        self._set_parameter_slices()
 
     @get_stressmodel
     def del_stressmodel(self, name):
@@ -235,6 +298,7 @@ class Model:
         """
         self.stressmodels.pop(name, None)
         self.parameters = self.get_init_parameters(initial=False)
+        self._set_parameter_slices()
 
     def del_constant(self):
         """ Save deletion of the constant from a Model.
@@ -245,6 +309,7 @@ class Model:
         else:
             self.constant = None
             self.parameters = self.get_init_parameters(initial=False)
+            self._set_parameter_slices()
 
     def del_transform(self):
         if self.transform is None:
@@ -252,6 +317,7 @@ class Model:
         else:
             self.transform = None
             self.parameters = self.get_init_parameters(initial=False)
+            self._set_parameter_slices()
 
     def del_noisemodel(self):
         """Save deletion of the noisemodel from the Model.
@@ -262,6 +328,7 @@ class Model:
         else:
             self.noisemodel = None
             self.parameters = self.get_init_parameters(initial=False)
+            self._set_parameter_slices()
 
     def simulate(self, parameters=None, tmin=None, tmax=None, freq=None,
                  warmup=None, return_warmup=False):
@@ -295,6 +362,11 @@ class Model:
         get an idea of how the simulation looks with only the initial
         parameters and no calibration.
 
+        When ml.settings["warmup_mode"] is "steady", the warmup period is
+        not simulated. Instead, the stresses are assumed to be constant and
+        equal to their mean over the warmup period before tmin, and the
+        contribution of this period is added to the simulation from tmin.
+
         """
         # Default options when tmin, tmax, freq and warmup are not provided.
         if tmin is None:
@@ -312,6 +384,41 @@ class Model:
         sim_index = self.get_sim_index(tmin, tmax, freq, warmup)
         dt = get_dt(freq)
 
+        sim = self._simulate(parameters, sim_index, freq, dt, warmup)
+
+        # Respect provided tmin/tmax at this point, since warmup matters for
+        # simulation but should not be returned, unless return_warmup=True.
+        if not return_warmup:
+            sim = sim.loc[tmin:tmax]
+
+        sim.dropna(inplace=True)
+        sim.name = 'Simulation'
+        return sim
+
+    def _simulate(self, parameters, sim_index, freq, dt, warmup,
+                  contributions=False, split=False):
+        """Internal method that simulates the model, including the warmup
+        period.
+
+        Parameters
+        ----------
+        contributions: bool, optional
+            Also return the contributions of the stressmodels, the constant
+            and the transform. Default is False.
+        split: bool, optional
+            Also return the contributions of the individual stresses of
+            stressmodels with more than one stress. Only used when
+            contributions is True. Default is False.
+
+        Returns
+        -------
+        sim: pandas.Series
+            The simulation.
+        contribs: collections.OrderedDict
+            The contributions, only when contributions is True. See
+            Model.get_contributions() for the keys.
+
+        """
         # Get parameters if none are provided
         if parameters is None:
             parameters = self.get_parameters()
@@ -319,27 +426,241 @@ class Model:
         sim = pd.Series(data=np.zeros(sim_index.size, dtype=float),
                         index=sim_index, fastpath=True)
 
-        istart = 0  # Track parameters index to pass to stressmodel object
-        for sm in self.stressmodels.values():
-            contrib = sm.simulate(parameters[istart: istart + sm.nparam],
-                                  sim_index.min(), sim_index.max(), freq, dt)
+        slices = self._parameter_slices
+        contribs = OrderedDict()
+        for name, sm in self.stressmodels.items():
+            p = parameters[slices[name]]
+            nstress = len(sm.stress)
+            if contributions and split and nstress > 1:
+                # The contribution of the stressmodel is the sum of the
+                # contributions of the stresses, so simulate these only
+                contrib = 0.0
+                for istress in range(nstress):
+                    h = self._simulate_stressmodel(sm, p, sim_index, freq, dt,
+                                                   warmup, istress)
+                    label = "%s (%s)" % (name, sm.stress[istress].name)
+                    contribs[label] = h
+                    contrib = contrib + h
+            else:
+                contrib = self._simulate_stressmodel(sm, p, sim_index, freq,
+                                                     dt, warmup)
+            contribs[name] = contrib
             sim = sim + contrib
-            istart += sm.nparam
         if self.constant:
-            sim = sim + self.constant.simulate(parameters[istart])
-            istart += 1
+            p = parameters[slices[self.constant.name]]
+            constant = self.constant.simulate(p[0])
+            contribs["constant"] = pd.Series(constant, index=sim.index)
+            sim = sim + constant
         if self.transform:
-            sim = self.transform.simulate(sim, parameters[
-                                               istart:istart + self.transform.nparam])
+            p = parameters[slices[self.transform.name]]
+            if contributions:
+                # The transform changes the series in place, so pass a copy
+                sim_t = self.transform.simulate(sim.copy(), p)
+                contribs["transform"] = sim_t - sim
+                sim = sim_t
+            else:
+                sim = self.transform.simulate(sim, p)
+
+        if contributions:
+            return sim, contribs
+        return sim
 
-        # Respect provided tmin/tmax at this point, since warmup matters for
-        # simulation but should not be returned, unless return_warmup=True.
-        if not return_warmup:
-            sim = sim.loc[tmin:tmax]
+    def _simulate_stressmodel(self, sm, p, sim_index, freq, dt, warmup,
+                              istress=None):
+        """Internal method to simulate the contribution of a stressmodel.
 
-        sim.dropna(inplace=True)
-        sim.name = 'Simulation'
-        return sim
+        In the steady warmup mode, the stress before the start of sim_index
+        is left out of the convolution and replaced by its steady state.
+
+        """
+        kwargs = dict()
+        if istress is not None:
+            kwargs["istress"] = istress
+        state = None
+        if self.settings["warmup_mode"] == "steady":
+            state = sm.steady_state(p, sim_index, freq, dt, warmup, istress)
+            if state is not None:
+                kwargs["tstart"] = sim_index[0]
+        contrib = sm.simulate(p, sim_index.min(), sim_index.max(), freq, dt,
+                              **kwargs)
+        if state is not None:
+            contrib = contrib + state
+        return contrib
+
+    def simulate_chunks(self, parameters=None, tmin=None, tmax=None,
+                        freq=None, warmup=None, return_warmup=False,
+                        chunksize=100000):
+        """Generator that simulates the time series model in chunks.
+
+        Parameters
+        ----------
+        parameters: array-like, optional
+            Array with the parameters used in the time series model. See
+            Model.get_parameters() for more info if parameters is None.
+        tmin: str, optional
+        tmax: str, optional
+        freq: str, optional
+            Frequency at which the time series are simulated.
+        warmup: int, optional
+            Length of the warmup period in days
+        return_warmup: bool, optional
+            Return the simulation including the the warmup period or not,
+            default is False.
+        chunksize: int, optional
+            Number of time steps in each chunk. Default is 100000.
+
+        Yields
+        ------
+        sim: pandas.Series
+            pandas.Series containing a chunk of the simulated time series.
+
+        Notes
+        -----
+        The chunks together are equal to the result of Model.simulate,
+        but the convolution of the stresses is computed chunk by chunk
+        (overlap-save), so the memory needed is bounded by the chunksize
+        and the length of the block responses instead of the length of the
+        simulation. This is useful for long series with a high frequency.
+
+        Examples
+        --------
+        >>> for sim in ml.simulate_chunks(chunksize=8760):
+        >>>     sim.to_csv(f, header=False)
+
+        See Also
+        --------
+        pastas.Model.simulate_memmap
+
+        """
+        if tmin is None:
+            tmin = self.settings['tmin']
+        if tmax is None:
+            tmax = self.settings['tmax']
+        if freq is None:
+            freq = self.settings["freq"]
+        if warmup is None:
+            warmup = self.settings["warmup"]
+
+        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=False,
+                                        use_stresses=True)
+
+        for sim in self._simulate_chunks(parameters, tmin, tmax, freq,
+                                         warmup, chunksize):
+            if not return_warmup:
+                sim = sim.loc[tmin:tmax]
+            sim = sim.dropna()
+            if not sim.empty:
+                yield sim
+
+    def simulate_memmap(self, fname, parameters=None, tmin=None, tmax=None,
+                        freq=None, warmup=None, chunksize=100000):
+        """Method to simulate the time series model into a memory-mapped
+        file.
+
+        Parameters
+        ----------
+        fname: str
+            String with the name of the file the simulation is written to.
+            An existing file is overwritten.
+        parameters: array-like, optional
+            Array with the parameters used in the time series model. See
+            Model.get_parameters() for more info if parameters is None.
+        tmin: str, optional
+        tmax: str, optional
+        freq: str, optional
+            Frequency at which the time series are simulated.
+        warmup: int, optional
+            Length of the warmup period in days
+        chunksize: int, optional
+            Number of time steps that are simulated at once. Default is
+            100000.
+
+        Returns
+        -------
+        sim: pandas.Series
+            pandas.Series containing the simulated time series, with the
+            values stored in a numpy.memmap of the file.
+
+        Notes
+        -----
+        The simulation is computed with Model.simulate_chunks and written
+        to the file chunk by chunk, so the full simulation never has to be
+        in memory. Contrary to Model.simulate, time steps without a
+        simulated value are kept as nan-values.
+
+        """
+        if tmin is None:
+            tmin = self.settings['tmin']
+        if tmax is None:
+            tmax = self.settings['tmax']
+        if freq is None:
+            freq = self.settings["freq"]
+        if warmup is None:
+            warmup = self.settings["warmup"]
+
+        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=False,
+                                        use_stresses=True)
+        sim_index = self.get_sim_index(tmin, tmax, freq, warmup)
+        istart = sim_index.searchsorted(tmin)
+        index = sim_index[istart:]
+
+        data = np.memmap(fname, dtype=float, mode="w+", shape=(index.size,))
+        for sim in self._simulate_chunks(parameters, tmin, tmax, freq,
+                                         warmup, chunksize):
+            sim = sim.loc[tmin:]
+            if not sim.empty:
+                i0 = index.get_loc(sim.index[0])
+                data[i0:i0 + sim.size] = sim.values
+        data.flush()
+
+        return pd.Series(data=data, index=index, name="Simulation",
+                         copy=False)
+
+    def _simulate_chunks(self, parameters, tmin, tmax, freq, warmup,
+                         chunksize):
+        """Internal generator that yields the simulation, including the
+        warmup period, for each chunk of the simulation index.
+
+        """
+        sim_index = self.get_sim_index(tmin, tmax, freq, warmup)
+        dt = get_dt(freq)
+
+        # Get parameters if none are provided
+        if parameters is None:
+            parameters = self.get_parameters()
+
+        slices = self._parameter_slices
+        states = []
+        contribs = []
+        for name, sm in self.stressmodels.items():
+            p = parameters[slices[name]]
+            tstart = None
+            if self.settings["warmup_mode"] == "steady":
+                state = sm.steady_state(p, sim_index, freq, dt, warmup)
+                if state is not None:
+                    states.append(state)
+                    tstart = sim_index[0]
+            contribs.append(sm.simulate_chunks(p, sim_index, freq, dt,
+                                               chunksize, tstart=tstart))
+        if self.constant:
+            pconstant = parameters[slices[self.constant.name]][0]
+        if self.transform:
+            ptransform = parameters[slices[self.transform.name]]
+
+        for i0 in range(0, sim_index.size, chunksize):
+            index = sim_index[i0:i0 + chunksize]
+            sim = pd.Series(data=np.zeros(index.size, dtype=float),
+                            index=index, fastpath=True)
+            for contrib in contribs:
+                sim = sim + next(contrib)
+            for state in states:
+                sim = sim + state.iloc[i0:i0 + chunksize]
+            if self.constant:
+                sim = sim + self.constant.simulate(pconstant)
+            if self.transform:
+                sim = self.transform.simulate(sim, ptransform)
+            sim.name = "Simulation"
+            yield sim
 
     def residuals(self, parameters=None, tmin=None, tmax=None, freq=None,
                   warmup=None):
@@ -451,7 +772,8 @@ class Model:
 
         # Calculate the noise
         noise = self.noisemodel.simulate(res, self.odelt.loc[res.index],
-                                         parameters[-self.noisemodel.nparam:])
+                                         parameters[self._parameter_slices[
+                                             self.noisemodel.name]])
         return noise
 
     def innovations(self, **kwargs):
@@ -516,7 +838,8 @@ class Model:
         return oseries_calib.loc[index]
 
     def initialize(self, tmin=None, tmax=None, freq=None, warmup=None,
-                   noise=None, weights=None, initial=True, fit_constant=None):
+                   noise=None, weights=None, initial=True, fit_constant=None,
+                   warmup_mode=None):
         """Method to initialize the model.
 
         This method is called by the solve-method, but can also be triggered
@@ -539,6 +862,8 @@ class Model:
 
         if warmup is not None:
             self.settings["warmup"] = warmup
+        if warmup_mode is not None:
+            self.settings["warmup_mode"] = warmup_mode
 
         # Set the time offset from the frequency
         # self.set_time_offset()
@@ -561,6 +886,7 @@ class Model:
 
         # Initialize parameters
         self.parameters = self.get_init_parameters(noise, initial)
+        self._set_parameter_slices()
 
         # Prepare model if not fitting the constant as a parameter
         if not self.settings["fit_constant"]:
@@ -570,7 +896,7 @@ class Model:
 
     def solve(self, tmin=None, tmax=None, solver=LeastSquares, report=True,
               noise=None, initial=True, freq=None, warmup=None, weights=None,
-              fit_constant=True, **kwargs):
+              fit_constant=True, warmup_mode=None, **kwargs):
         """Method to solve the time series model.
 
         Parameters
@@ -610,6 +936,12 @@ class Model:
             Argument that determines if the constant is fitted as a parameter.
             If it is set to False, the constant is set equal to the mean of
             the residuals.
+        warmup_mode: str, optional
+            String with the method to deal with the warmup period. Options
+            are "simulate" (default) to simulate the warmup period, or
+            "steady" to start the simulation at tmin and approximate the
+            effect of the warmup period from the mean stresses. The latter
+            is faster for long warmup periods.
         **kwargs: dict, optional
             All keyword arguments will be passed onto the solver. It depends
             on the solver used which
@@ -618,7 +950,7 @@ class Model:
 
         # Initialize the model
         self.initialize(tmin, tmax, freq, warmup, noise, weights, initial,
-                        fit_constant)
+                        fit_constant, warmup_mode)
         self.settings["solver"] = solver._name
 
         # Solve model
@@ -818,17 +1150,20 @@ class Model:
             which the model is simulated.
 
         """
-        # Check if any of the settings are updated
-        update_sim_index = False
-        for key, setting in zip([tmin, tmax, freq, warmup],
-                                ["tmin", "tmax", "freq", "warmup"]):
-            if key != self.settings[setting]:
-                update_sim_index = True
+        # Only compute the sim_index again when it was computed for other
+        # arguments or settings
+        key = (tmin, tmax, freq, warmup, self.settings["warmup_mode"],
+               self.settings["time_offset"])
+
+        if self.settings["warmup_mode"] == "steady":
+            # The warmup period is not simulated in steady mode
+            warmup = 0
 
-        if self.sim_index is None or update_sim_index:
+        if self.sim_index is None or key != self._sim_index_key:
             tmin = (tmin - pd.DateOffset(days=warmup)).floor(freq) + \
                    self.settings["time_offset"]
             self.sim_index = pd.date_range(tmin, tmax, freq=freq, name="Date")
+            self._sim_index_key = key
 
         return self.sim_index
 
@@ -967,16 +1302,18 @@ class Model:
         if noise is None:
             noise = self.settings['noise']
 
-        parameters = pd.DataFrame(columns=['initial', 'pmin', 'pmax', 'vary',
-                                           'optimal', 'name', 'stderr'])
+        parameters = []
         for sm in self.stressmodels.values():
-            parameters = parameters.append(sm.parameters)
+            parameters.append(sm.parameters)
         if self.constant:
-            parameters = parameters.append(self.constant.parameters)
+            parameters.append(self.constant.parameters)
         if self.transform:
-            parameters = parameters.append(self.transform.parameters)
+            parameters.append(self.transform.parameters)
         if self.noisemodel and noise:
-            parameters = parameters.append(self.noisemodel.parameters)
+            parameters.append(self.noisemodel.parameters)
+
+        # Concatenate all parameters at once
+        parameters = concat_parameters(parameters)
 
         # Set initial parameters to optimal parameters from model
         if not initial:
@@ -985,6 +1322,53 @@ class Model:
 
         return parameters
 
+    def _get_component_names(self, skip=None):
+        """Internal method to get the names of the components of the model.
+
+        Parameters
+        ----------
+        skip: str, optional
+            Leave out the names of the components of this kind: one of
+            "stressmodels", "constant", "transform" or "noisemodel".
+
+        Notes
+        -----
+        The parameter slices are stored by the name of the component, so
+        the names of the components have to be unique.
+
+        """
+        components = OrderedDict([
+            ("stressmodels", list(self.stressmodels.values())),
+            ("constant", [self.constant]),
+            ("transform", [self.transform]),
+            ("noisemodel", [self.noisemodel])])
+        return [component.name for kind, values in components.items()
+                if kind != skip for component in values
+                if component is not None]
+
+    def _set_parameter_slices(self):
+        """Internal method to store the position of the parameters of each
+        component in the parameters, so the parameters of a component are
+        found without searching the parameters.
+
+        Notes
+        -----
+        The components are in the same order as in
+        Model.get_init_parameters. The noisemodel is last, so its slice is
+        empty when the parameters of the noisemodel are left out.
+
+        """
+        components = list(self.stressmodels.values()) + [
+            self.constant, self.transform, self.noisemodel]
+        slices = OrderedDict()
+        istart = 0
+        for component in components:
+            if component is not None:
+                slices[component.name] = slice(istart,
+                                               istart + component.nparam)
+                istart += component.nparam
+        self._parameter_slices = slices
+
     def get_parameters(self, name=None):
         """Internal method to obtain the parameters needed for calculation.
 
@@ -1002,19 +1386,23 @@ class Model:
             Numpy array with the parameters used in the time series model.
 
         """
-        if name:
-            p = self.parameters[self.parameters.name == name]
+        if not name:
+            rows = slice(None)
+        elif name in self._parameter_slices:
+            rows = self._parameter_slices[name]
         else:
-            p = self.parameters
+            rows = (self.parameters.name == name).values
 
-        if p.optimal.hasnans:
+        parameters = self.parameters.optimal.values[rows]
+        if pd.isnull(parameters).any():
             self.logger.warning(
                 "Model is not optimized yet, initial parameters are used.")
-            parameters = p.initial
-        else:
-            parameters = p.optimal
+            parameters = self.parameters.initial.values[rows]
 
-        return parameters.values
+        if name:
+            # Do not return a view on the parameters of the model
+            parameters = parameters.copy()
+        return parameters
 
     @get_stressmodel
     def get_contribution(self, name, tmin=None, tmax=None, freq=None,
@@ -1052,23 +1440,14 @@ class Model:
         if warmup is None:
             warmup = self.settings["warmup"]
 
-        # use warmup
-        if tmin:
-            tmin_warm = pd.Timestamp(tmin) - pd.DateOffset(days=warmup)
-        else:
-            tmin_warm = None
-
+        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=False,
+                                        use_stresses=True)
+        sim_index = self.get_sim_index(tmin, tmax, freq, warmup)
         dt = get_dt(freq)
 
-        if istress is None:
-            contrib = self.stressmodels[name].simulate(p, tmin=tmin_warm,
-                                                       tmax=tmax,
-                                                       freq=freq, dt=dt)
-        else:
-            contrib = self.stressmodels[name].simulate(p, tmin=tmin_warm,
-                                                       tmax=tmax,
-                                                       dt=dt, freq=freq,
-                                                       istress=istress)
+        contrib = self._simulate_stressmodel(self.stressmodels[name], p,
+                                             sim_index, freq, dt, warmup,
+                                             istress)
         # Respect provided tmin/tmax at this point, since warmup matters for
         # simulation but should not be returned, unless return_warmup=True.
         if not return_warmup:
@@ -1076,13 +1455,106 @@ class Model:
 
         return contrib
 
+    def get_contributions(self, parameters=None, tmin=None, tmax=None,
+                          freq=None, warmup=None, split=True,
+                          return_warmup=False):
+        """Method to get the contributions of all stressmodels, the
+        constant and the transform, together with the simulation, from a
+        single simulation of the model.
+
+        Parameters
+        ----------
+        parameters: array-like, optional
+            Array with the parameters used in the time series model. See
+            Model.get_parameters() for more info if parameters is None.
+        tmin: str or pandas.TimeStamp, optional
+        tmax: str or pandas.TimeStamp, optional
+        freq: str, optional
+        warmup: int, optional
+            Length of the warmup period in days
+        split: bool, optional
+            Also return the contribution of the individual stresses of
+            stressmodels with more than one stress. Default is True.
+        return_warmup: bool, optional
+            Return the contributions including the the warmup period or not,
+            default is False.
+
+        Returns
+        -------
+        contribs: pandas.DataFrame
+            DataFrame with a column for the contribution of each
+            stressmodel, named after the stressmodel, and the columns
+            "constant" and "transform" when the model has a constant or a
+            transform. When split is True, the contributions of the
+            individual stresses are added as columns named "name (stress)".
+            The last column "Simulation" contains the simulation.
+
+        Notes
+        -----
+        The contribution of a stressmodel with more than one stress is the
+        sum of the contributions of its stresses when split is True. The
+        transform column contains the difference between the simulation
+        with and without the transform.
+
+        """
+        if tmin is None:
+            tmin = self.settings['tmin']
+        if tmax is None:
+            tmax = self.settings['tmax']
+        if freq is None:
+            freq = self.settings["freq"]
+        if warmup is None:
+            warmup = self.settings["warmup"]
+
+        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=False,
+                                        use_stresses=True)
+        sim_index = self.get_sim_index(tmin, tmax, freq, warmup)
+        dt = get_dt(freq)
+
+        sim, contribs = self._simulate(parameters, sim_index, freq, dt,
+                                       warmup, contributions=True,
+                                       split=split)
+        contribs["Simulation"] = sim
+
+        contribs = pd.DataFrame(contribs, index=sim.index)
+        if not return_warmup:
+            contribs = contribs.loc[tmin:tmax]
+        contribs = contribs[contribs["Simulation"].notna()]
+        return contribs
+
     def get_transform_contribution(self, tmin=None, tmax=None):
-        sim = self.simulate(tmin=tmin, tmax=tmax)
-        # calculate what the simulation without the transform is
-        ml = copy(self)
-        ml.del_transform()
-        sim_org = ml.simulate(tmin=tmin, tmax=tmax)
-        return sim - sim_org
+        """Method to get the contribution of the transform, i.e. the
+        difference between the simulation with and without the transform.
+
+        Parameters
+        ----------
+        tmin: str or pandas.TimeStamp, optional
+        tmax: str or pandas.TimeStamp, optional
+
+        Returns
+        -------
+        contrib: pandas.Series
+            Pandas Series with the contribution of the transform.
+
+        """
+        if tmin is None:
+            tmin = self.settings['tmin']
+        if tmax is None:
+            tmax = self.settings['tmax']
+        freq = self.settings["freq"]
+        warmup = self.settings["warmup"]
+
+        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=False,
+                                        use_stresses=True)
+        sim_index = self.get_sim_index(tmin, tmax, freq, warmup)
+        dt = get_dt(freq)
+
+        sim, contribs = self._simulate(None, sim_index, freq, dt, warmup,
+                                       contributions=True)
+        contrib = contribs.get("transform", pd.Series(0.0, index=sim.index))
+        contrib = contrib.loc[tmin:tmax].dropna()
+        contrib.name = self.transform.name if self.transform else "transform"
+        return contrib
 
     @get_stressmodel
     def get_block_response(self, name, **kwargs):
@@ -1271,6 +1743,9 @@ class Model:
             raise ValueError('The model is not solved yet')
         if output != "full":
             raise NotImplementedError
+        if self.oseries_calib is None:
+            # The observations are left out when the model is pickled
+            self.observations()
 
         model = {
             "nfev": self.fit.nfev,
@@ -1365,6 +1840,61 @@ Parameters (%s were optimized)
         pmin = pnorm < alpha
         return pmin, pmax
 
+    def clone(self, name=None):
+        """Method to create a copy of the model, e.g. to create variants of
+        the model with other settings or components.
+
+        Parameters
+        ----------
+        name: str, optional
+            Name of the new model. Default is None, in which case the name
+            of this model is used.
+
+        Returns
+        -------
+        ml: pastas.Model
+            The new model.
+
+        Notes
+        -----
+        The parameters, settings and components of the new model are
+        copies, but the TimeSeries share their series with the TimeSeries
+        of this model (see TimeSeries.clone). Creating many variants of a
+        model therefore does not copy the series, until the settings of a
+        TimeSeries are changed.
+
+        Examples
+        --------
+        >>> ml2 = ml.clone(name="gamma")
+        >>> ml2.add_stressmodel(ps.StressModel(prec, ps.Gamma, "recharge"),
+        >>>                     replace=True)
+
+        """
+        # Do not use copy, which leaves out the helpers (see __getstate__)
+        ml = self.__class__.__new__(self.__class__)
+        ml.__dict__.update(self.__dict__)
+        if name is not None:
+            ml.name = str(name)
+
+        ml.oseries = self.oseries.clone()
+        ml.stressmodels = OrderedDict(
+            (key, _clone_component(sm)) for key, sm in
+            self.stressmodels.items())
+        ml.constant = _clone_component(self.constant)
+        ml.transform = _clone_component(self.transform)
+        ml.noisemodel = _clone_component(self.noisemodel)
+
+        ml.parameters = self.parameters.copy()
+        ml._parameter_slices = self._parameter_slices.copy()
+        ml.settings = self.settings.copy()
+        ml.file_info = self.file_info.copy()
+
+        # The helper classes hold a reference to the model
+        ml.stats = Statistics(ml)
+        ml.plots = Plotting(ml)
+        ml.plot = ml.plots.plot
+        return ml
+
     def dump_data(self, series=True, sim_series=False, file_info=True):
         """Internal method to export a PASTAS model to the json export format.
 
@@ -1450,3 +1980,19 @@ Parameters (%s were optimized)
 
         # Write the dicts to a file
         return dump(fname, data, **kwargs)
+
+
+def _clone_component(component):
+    """Internal method to copy a stressmodel, constant, transform or
+    noisemodel for Model.clone, sharing the series of its TimeSeries.
+
+    """
+    if component is None:
+        return None
+    clone = copy(component)
+    clone.parameters = component.parameters.copy()
+    if hasattr(component, "rfunc"):
+        clone.rfunc = copy(component.rfunc)
+    if hasattr(component, "stress"):
+        clone.stress = [stress.clone() for stress in component.stress]
+    return clone
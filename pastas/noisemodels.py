@@ -12,6 +12,7 @@ import numpy as np
 import pandas as pd
 
 from .decorators import set_parameter
+from .parameters import create_parameters
 
 logger = getLogger(__name__)
 
@@ -24,8 +25,7 @@ class NoiseModelBase(ABC):
     def __init__(self):
         self.nparam = 0
         self.name = "noise"
-        self.parameters = pd.DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
+        self.parameters = create_parameters()
 
     @set_parameter
     def set_initial(self, name, value):
@@ -123,7 +123,8 @@ class NoiseModel(NoiseModelBase):
         self.set_init_parameters()
 
     def set_init_parameters(self):
-        self.parameters.loc['noise_alpha'] = (14.0, 0, 5000, 1, 'noise')
+        self.parameters = create_parameters(
+            [('noise_alpha', 14.0, 0, 5000, 1, 'noise')])
 
     def simulate(self, res, odelt, parameters):
         """
@@ -206,7 +207,8 @@ class NoiseModel2(NoiseModelBase):
         self.set_init_parameters()
 
     def set_init_parameters(self):
-        self.parameters.loc['noise_alpha'] = (14.0, 0, 5000, 1, 'noise')
+        self.parameters = create_parameters(
+            [('noise_alpha', 14.0, 0, 5000, 1, 'noise')])
 
     def simulate(self, res, odelt, parameters):
         """
@@ -0,0 +1,88 @@
+"""This module contains the methods to create the tables with the parameters
+of the model components and of the model.
+
+The tables are created at once from an array for each column, instead of
+adding the parameters row by row, which makes creating models much faster.
+
+Examples
+--------
+
+>>> parameters = create_parameters([("recharge_A", 1.0, 0.0, 100.0, 1,
+>>>                                  "recharge")])
+
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+from pandas import DataFrame
+
+# Columns of the parameters of a component and of a model
+_columns = ["initial", "pmin", "pmax", "vary", "name"]
+_model_columns = ["initial", "pmin", "pmax", "vary", "optimal", "name",
+                  "stderr"]
+
+
+def create_parameters(rows=(), parameters=None):
+    """Method to create the DataFrame with the parameters of a component.
+
+    Parameters
+    ----------
+    rows: list of tuples, optional
+        List with a tuple (parameter name, initial, pmin, pmax, vary, name)
+        for each parameter.
+    parameters: pandas.DataFrame, optional
+        DataFrame with parameters that are placed before the rows.
+
+    Returns
+    -------
+    parameters: pandas.DataFrame
+        DataFrame with the parameter names as index and the columns initial,
+        pmin, pmax, vary and name.
+
+    """
+    rows = list(rows)
+    if parameters is not None:
+        rows = list(parameters.loc[:, _columns].itertuples(name=None)) + rows
+
+    index = [row[0] for row in rows]
+    values = [row[1:] for row in rows]
+
+    data = OrderedDict()
+    data["initial"] = np.array([v[0] for v in values], dtype=float)
+    data["pmin"] = np.array([v[1] for v in values], dtype=float)
+    data["pmax"] = np.array([v[2] for v in values], dtype=float)
+    data["vary"] = np.array([v[3] for v in values], dtype=int)
+    data["name"] = np.array([v[4] for v in values], dtype=object)
+    return DataFrame(data, index=index, columns=_columns)
+
+
+def concat_parameters(parameters):
+    """Method to create the DataFrame with the parameters of a model from
+    the parameters of its components.
+
+    Parameters
+    ----------
+    parameters: list of pandas.DataFrame
+        List with the parameters of the components, in the order in which
+        they are used in the model.
+
+    Returns
+    -------
+    parameters: pandas.DataFrame
+        DataFrame with the parameter names as index and the columns initial,
+        pmin, pmax, vary, optimal, name and stderr, where optimal and stderr
+        are nan.
+
+    """
+    parameters = list(parameters)
+    if not parameters:
+        parameters = [create_parameters()]
+
+    data = OrderedDict()
+    for col in _columns:
+        data[col] = np.concatenate([p[col].values for p in parameters])
+    index = np.concatenate([p.index.values for p in parameters])
+    data["optimal"] = np.full(index.size, np.nan)
+    data["stderr"] = np.full(index.size, np.nan)
+    return DataFrame(data, index=index, columns=_model_columns)
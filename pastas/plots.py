@@ -5,20 +5,80 @@ Examples
 --------
     ml.plot.decomposition()
 
+Matplotlib is imported in the methods, so it is only imported when a plot is
+made and not when Pastas is imported.
+
+Long series are downsampled before they are drawn, keeping the minimum and
+maximum value for every pixel of the width of the axes, so the figures look
+the same but are drawn much faster. Set the downsample attribute to False to
+draw all values:
+
+    ml.plots.downsample = False
+
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.ticker import MultipleLocator
-from scipy.stats import probplot
 
 from .decorators import model_tmin_tmax
 from .stats import acf
 
 
+def minmax_downsample(series, n):
+    """Method to downsample a series to the minimum and maximum value in
+    each of n buckets, preserving the shape of the series when it is drawn.
+
+    Parameters
+    ----------
+    series: pandas.Series
+        Series to downsample.
+    n: int
+        Number of buckets, e.g. the width of the axes in pixels.
+
+    Returns
+    -------
+    series: pandas.Series
+        Series with at most 2 * n + 2 values of the original series, in the
+        original order. The series is returned as is when it has less than
+        4 * n values.
+
+    Notes
+    -----
+    The buckets contain an equal number of values. The first and last value
+    are always kept and a bucket with only nan-values is kept as a nan-value,
+    so gaps in the series are drawn as well.
+
+    """
+    size = series.size
+    n = max(int(n), 1)
+    if size < 4 * n:
+        return series
+
+    k = -(-size // n)  # number of values per bucket, rounded up
+    values = np.full(n * k, np.nan)
+    values[:size] = series.values
+    values = values.reshape(n, k)
+    isnan = np.isnan(values)
+    imin = np.where(isnan, np.inf, values).argmin(axis=1)
+    imax = np.where(isnan, -np.inf, values).argmax(axis=1)
+
+    offset = np.arange(n) * k
+    index = np.concatenate([[0, size - 1], offset + imin, offset + imax])
+    index = np.unique(index[index < size])
+    return series.iloc[index]
+
+
+def get_axes_width(ax):
+    """Method to get the width of a matplotlib axes in pixels.
+
+    """
+    fig = ax.get_figure()
+    return ax.get_position().width * fig.get_figwidth() * fig.dpi
+
+
 class Plotting:
     def __init__(self, ml):
         self.ml = ml  # Store a reference to the model class
+        self.downsample = True
 
     def __repr__(self):
         msg = "This module contains all the built-in plotting options that are " \
@@ -43,6 +103,7 @@ class Plotting:
             matplotlib axes with the simulated and optionally the observed time series.
 
         """
+        import matplotlib.pyplot as plt
         fig = self._get_figure(**kwargs)
         fig.suptitle("Results of " + self.ml.name)
 
@@ -57,6 +118,7 @@ class Plotting:
 
         if simulation:
             sim = self.ml.simulate(tmin=tmin, tmax=tmax)
+            sim = self._downsample(sim, fig.gca())
             sim.plot(fig=fig)
         plt.xlim(tmin, tmax)
         plt.ylabel("Groundwater levels [meter]")
@@ -78,6 +140,7 @@ class Plotting:
         -------
 
         """
+        import matplotlib.pyplot as plt
         fig = self._get_figure(figsize=figsize, **kwargs)
 
         # Number of rows to make the figure with
@@ -92,8 +155,9 @@ class Plotting:
             o_nu.plot(ax=ax1, linestyle='', marker='.', color='0.5', label='',
                       x_compat=True)
         o.plot(ax=ax1, linestyle='', marker='.', color='k', x_compat=True)
-        sim = self.ml.simulate(tmin=tmin, tmax=tmax)
-        sim.plot(ax=ax1, x_compat=True)
+        contribs = self.ml.get_contributions(tmin=tmin, tmax=tmax, split=False)
+        sim = contribs["Simulation"]
+        self._downsample(sim, ax1).plot(ax=ax1, x_compat=True)
         ax1.legend(loc=(0, 1), ncol=3, frameon=False)
         ax1.set_ylim(min(o.min(), sim.loc[tmin:tmax].min()),
                      max(o.max(), sim.loc[tmin:tmax].max()))
@@ -102,9 +166,11 @@ class Plotting:
         # Residuals and noise
         ax2 = plt.subplot2grid((rows, 3), (2, 0), colspan=2, sharex=ax1)
         res = self.ml.residuals(tmin=tmin, tmax=tmax)
+        res = self._downsample(res, ax2)
         res.plot(ax=ax2, sharex=ax1, color='k', x_compat=True)
         if self.ml.settings["noise"] and self.ml.noisemodel:
             noise = self.ml.noise(tmin=tmin, tmax=tmax)
+            noise = self._downsample(noise, ax2)
             noise.plot(ax=ax2, sharex=ax1, x_compat=True)
         ax2.legend(loc=(0, 1), ncol=3, frameon=False)
         ax2.minorticks_off()
@@ -116,7 +182,7 @@ class Plotting:
         # Add a row for each stressmodel
         for i, sm in enumerate(self.ml.stressmodels.keys(), start=3):
             ax = plt.subplot2grid((rows, 3), (i, 0), colspan=2, sharex=ax1)
-            contrib = self.ml.get_contribution(sm, tmin=tmin, tmax=tmax)
+            contrib = self._downsample(contribs[sm], ax)
             contrib.plot(ax=ax, sharex=ax1, x_compat=True)
             title = [stress.name for stress in self.ml.stressmodels[sm].stress]
             plt.title("Stresses:%s" % title, loc="right")
@@ -168,31 +234,31 @@ class Plotting:
         axes: list of matplotlib.axes
 
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import MultipleLocator
         o = self.ml.observations(tmin=tmin, tmax=tmax)
 
-        # determine the simulation
-        sim = self.ml.simulate(tmin=tmin, tmax=tmax)
+        # determine the simulation and the influence of the different
+        # stresses at once
+        contribs = self.ml.get_contributions(tmin=tmin, tmax=tmax,
+                                             split=split)
+        sim = contribs["Simulation"]
         series = [sim]
         names = ['']
 
-        # determine the influence of the different stresses
-        for name in self.ml.stressmodels.keys():
-            nstress = len(self.ml.stressmodels[name].stress)
+        for name, sm in self.ml.stressmodels.items():
+            nstress = len(sm.stress)
             if split and nstress > 1:
-                for istress in range(nstress):
-                    contrib = self.ml.get_contribution(name, tmin=tmin,
-                                                       tmax=tmax,
-                                                       istress=istress)
-                    series.append(contrib)
-                    names.append(contrib.name)
+                for stress in sm.stress:
+                    label = "%s (%s)" % (name, stress.name)
+                    series.append(contribs[label])
+                    names.append(label)
             else:
-                contrib = self.ml.get_contribution(name, tmin=tmin, tmax=tmax)
-                series.append(contrib)
-                names.append(contrib.name)
+                series.append(contribs[name])
+                names.append(name)
 
         if self.ml.transform:
-            series.append(
-                self.ml.get_transform_contribution(tmin=tmin, tmax=tmax))
+            series.append(contribs["transform"])
             names.append(self.ml.transform.name)
 
         # determine ylim for every graph, to scale the height
@@ -226,7 +292,7 @@ class Plotting:
                       markersize=2, ax=ax[0], x_compat=True)
         o.plot(linestyle='', marker='.', color='k',
                markersize=3, ax=ax[0], x_compat=True)
-        sim.plot(ax=ax[0], x_compat=True)
+        self._downsample(sim, ax[0]).plot(ax=ax[0], x_compat=True)
         ax[0].set_title('Observations vs simulation')
         ax[0].set_ylim(ylims[0])
         ax[0].grid(which='both')
@@ -245,6 +311,7 @@ class Plotting:
 
         # plot the influence of the stresses
         for i, contrib in enumerate(series[1:], start=1):
+            contrib = self._downsample(contrib, ax[i])
             contrib.plot(ax=ax[i], x_compat=True)
 
             if ytick_base:
@@ -264,6 +331,8 @@ class Plotting:
 
     @model_tmin_tmax
     def diagnostics(self, tmin=None, tmax=None):
+        import matplotlib.pyplot as plt
+        from scipy.stats import probplot
         noise = self.ml.noise(tmin=tmin, tmax=tmax)
 
         fig = self._get_figure()
@@ -299,6 +368,7 @@ class Plotting:
             matplotlib axes instance.
 
         """
+        import matplotlib.pyplot as plt
         if not series:
             series = self.ml.stressmodels.keys()
         else:
@@ -338,6 +408,7 @@ class Plotting:
             matplotlib axes instance.
 
         """
+        import matplotlib.pyplot as plt
         if not series:
             series = self.ml.stressmodels.keys()
         else:
@@ -387,6 +458,7 @@ class Plotting:
             matplotlib axes instance.
 
         """
+        import matplotlib.pyplot as plt
         stresses = []
 
         for name in self.ml.stressmodels.keys():
@@ -414,7 +486,7 @@ class Plotting:
             axes = [axes]
 
         for ax, stress in zip(axes, stresses):
-            stress.plot(ax=ax)
+            self._downsample(stress, ax).plot(ax=ax)
             ax.legend([stress.name], loc=2)
 
         plt.xlim(tmin, tmax)
@@ -422,6 +494,18 @@ class Plotting:
 
         return axes
 
+    def _downsample(self, series, ax):
+        """Internal method to downsample a series to the width of the axes
+        it is drawn on, unless the downsample attribute is False. Only use
+        this for series that are drawn as a line, as the values between the
+        minimum and maximum of each bucket are left out.
+
+        """
+        if not self.downsample:
+            return series
+        return minmax_downsample(series, get_axes_width(ax))
+
     def _get_figure(self, **kwargs):
+        import matplotlib.pyplot as plt
         fig = plt.figure(**kwargs)
         return fig
@@ -0,0 +1,169 @@
+"""This module contains the LazyModels class that stores the models of a
+Pastas Project.
+
+The models that are loaded from a file are only created when they are
+accessed, and the least recently used models are removed from memory again
+when more than a maximum number of models are created.
+
+Examples
+--------
+
+>>> mls = ps.io.load("project.pas", lazy=True, max_models=100)
+>>> mls.get_parameters(["recharge_A"])  # Does not create the models
+>>> ml = mls.models["B32C0572"]  # Creates the model
+
+"""
+
+from collections import OrderedDict
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+import pandas as pd
+
+import pastas as ps
+
+
+class LazyModels(MutableMapping):
+    """Dictionary-like container for the models of a project, that creates
+    the models from their data on first access.
+
+    Parameters
+    ----------
+    data: dict, optional
+        Dictionary with the model names as keys and the dictionaries with
+        the data to create the models (as returned by Model.dump_data) as
+        values.
+    max_models: int, optional
+        Maximum number of models that are kept in memory. When more models
+        are accessed, the least recently used model is converted back to its
+        data. Default is None, in which case all models are kept in memory.
+
+    Notes
+    -----
+    An evicted model is stored as its data and a new Model is created the
+    next time it is accessed, so keep a reference to the Model returned by
+    the container only as long as it is used.
+
+    """
+
+    def __init__(self, data=None, max_models=None):
+        self._data = OrderedDict()
+        self._models = OrderedDict()
+        self.max_models = max_models
+        if data is not None:
+            self._data.update(data)
+
+    def __repr__(self):
+        return "%s(%s models, %s in memory)" % (self.__class__.__name__,
+                                                len(self), len(self._models))
+
+    def __getitem__(self, name):
+        if name in self._models:
+            self._models.move_to_end(name)
+            return self._models[name]
+
+        # load_model changes the data, so keep it intact when loading fails
+        ml = ps.io.base.load_model(_copy_data(self._data[name]))
+        self._data[name] = None
+        self._models[name] = ml
+        self._evict()
+        return ml
+
+    def __setitem__(self, name, ml):
+        self._data[name] = None
+        self._models[name] = ml
+        self._models.move_to_end(name)
+        self._evict()
+
+    def __delitem__(self, name):
+        del self._data[name]
+        self._models.pop(name, None)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def is_loaded(self, name):
+        """Method to check if a model is in memory as a Model.
+
+        """
+        return name in self._models
+
+    def get_parameters(self, name):
+        """Method to get the parameters DataFrame of a model, without
+        creating the model when it is not in memory.
+
+        """
+        if name in self._models:
+            return self._models[name].parameters
+        return self._data[name]["parameters"]
+
+    def dump_data(self, name, **kwargs):
+        """Method to get the data of a model, without creating the model
+        when it is not in memory.
+
+        Parameters
+        ----------
+        name: str
+            Name of the model.
+        kwargs: any argument that is passed to the Model.dump_data() method.
+
+        Returns
+        -------
+        data: dict
+            dictionary with the data of the model.
+
+        """
+        series = kwargs.get("series", True)
+        if name in self._models or series == "modified" or \
+                kwargs.get("sim_series", False):
+            # These need the model, so create it when it is not in memory
+            return self[name].dump_data(**kwargs)
+
+        # Return a copy, so the data can be changed
+        data = _copy_data(self._data[name])
+        if not series:
+            for ts in [data["oseries"]] + [ts for sm in
+                                           data["stressmodels"].values()
+                                           for ts in sm.get("stress", [])]:
+                ts.pop("series", None)
+                ts.pop("validated", None)
+        if kwargs.get("file_info", True):
+            data.setdefault("file_info", dict())
+            data["file_info"]["date_modified"] = pd.Timestamp.now()
+        else:
+            data.pop("file_info", None)
+        return data
+
+    def _evict(self):
+        """Internal method to remove the least recently used models from
+        memory when there are more than max_models in memory.
+
+        """
+        if self.max_models is None:
+            return
+        while len(self._models) > self.max_models:
+            name, ml = self._models.popitem(last=False)
+            # The series are stored by reference, so this does not copy them
+            data = ml.dump_data(series=True, file_info=False)
+            data["file_info"] = ml.file_info
+            self._data[name] = data
+
+
+def _copy_data(data):
+    """Internal method to copy the dictionaries and lists in the data of a
+    model, without copying the other objects (e.g. the series).
+
+    """
+    if isinstance(data, dict):
+        return data.__class__((key, _copy_data(value)) for key, value in
+                              data.items())
+    elif isinstance(data, list):
+        return [_copy_data(value) for value in data]
+    else:
+        return data
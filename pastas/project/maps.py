@@ -4,8 +4,6 @@ Raoul Collenteur, 2018 - Artesia Water
 
 """
 
-import matplotlib.pyplot as plt
-
 
 class Map:
     def __init__(self, mls):
@@ -121,6 +119,7 @@ class Map:
             The axes are returned.
 
         """
+        import matplotlib.pyplot as plt
         if models is None:
             models = values.index
             models = self.mls.oseries.loc[models, "z"].sort_values(
@@ -168,6 +167,7 @@ class Map:
             Return the axes.
 
         """
+        import matplotlib.pyplot as plt
         if kind == "oseries":
             series = self.mls.oseries
         elif kind == "stresses":
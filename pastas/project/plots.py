@@ -1,9 +1,13 @@
 """This module contains plottings methods for Pastas projects.
 
+Like for the models, long series are downsampled before they are drawn, which
+is turned off by setting mls.plots.downsample to False.
+
 Raoul Collenteur, 2018 - Artesia Water.
 
 """
-import matplotlib.pyplot as plt
+
+from ..plots import minmax_downsample, get_axes_width
 
 
 class Plot:
@@ -17,6 +21,7 @@ class Plot:
 
         """
         self.mls = mls
+        self.downsample = True
 
     def stresses(self, kind=None, cols=2, **kwargs):
         """Make plots of the stresses in different subplots.
@@ -34,6 +39,7 @@ class Plot:
             returns a list of matplotlib axes instances.
 
         """
+        import matplotlib.pyplot as plt
         if isinstance(kind, str):
             kinds = [kind]
         else:
@@ -57,7 +63,9 @@ class Plot:
             ax = [ax]
 
         for i, key in enumerate(stresses):
-            self.mls.stresses.loc[key, "series"].series.plot(ax=ax[i],
-                                                             x_compat=True)
+            series = self.mls.stresses.loc[key, "series"].series
+            if self.downsample:
+                series = minmax_downsample(series, get_axes_width(ax[i]))
+            series.plot(ax=ax[i], x_compat=True)
             ax[i].legend([key], loc=2)
         return ax
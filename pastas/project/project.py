@@ -12,6 +12,7 @@ Usage
 
 """
 
+from hashlib import sha1
 from logging import getLogger
 from os import getlogin
 
@@ -19,6 +20,7 @@ import numpy as np
 import pandas as pd
 import pastas as ps
 
+from .lazy import LazyModels
 from .maps import Map
 from .plots import Plot
 
@@ -42,7 +44,7 @@ class Project:
             Dictionary with any metadata information on the project.
 
         """
-        self.models = {}
+        self.models = LazyModels()
         self.name = name
         # Store the data in Pandas dataframes
         self.data = pd.DataFrame()
@@ -319,10 +321,11 @@ class Project:
         data = pd.DataFrame(index=models, columns=parameters)
 
         for ml_name in models:
-            ml = self.models[ml_name]
+            # Get the parameters without creating models that are not loaded
+            ml_parameters = self.models.get_parameters(ml_name)
             for parameter in parameters:
-                if parameter in ml.parameters.index:
-                    value = ml.parameters.loc[parameter, param_value]
+                if parameter in ml_parameters.index:
+                    value = ml_parameters.loc[parameter, param_value]
                     data.loc[ml_name, parameter] = value
 
         data = data.squeeze()
@@ -459,13 +462,22 @@ class Project:
 
         Parameters
         ----------
-        fname: string
-            string with the name and optionally the file-extension.
+        series: bool, optional
+            Export the series of the models as well. The project series are
+            always exported.
+        sim_series: bool, optional
+            Export the simulated series (not implemented yet).
 
         Returns
         -------
-        message: str
-            Returns a message if export was successful or not.
+        data: dict
+            dictionary with all the data to recreate the project.
+
+        Notes
+        -----
+        Each unique series is stored only once in data["series_table"],
+        with a hash of its content as the key. The oseries, stresses and
+        models reference the series with this key in "series_hash".
 
         """
         data = dict(
@@ -475,24 +487,69 @@ class Project:
             file_info=self.file_info
         )
 
+        series_table = dict()
+        hashes = dict()
+
         # Series DataFrame
-        data["oseries"] = self._series_to_dict(self.oseries)
-        data["stresses"] = self._series_to_dict(self.stresses)
+        data["oseries"] = self._series_to_dict(self.oseries, series_table,
+                                               hashes)
+        data["stresses"] = self._series_to_dict(self.stresses, series_table,
+                                                hashes)
 
         # Models
         data["models"] = dict()
-        for name, ml in self.models.items():
-            data["models"][name] = ml.dump_data(series=series,
-                                                sim_series=sim_series,
-                                                file_info=False)
+        for name in self.models:
+            mldata = self.models.dump_data(name, series=series,
+                                           sim_series=sim_series,
+                                           file_info=False)
+            self._add_to_series_table(mldata["oseries"], series_table,
+                                      hashes)
+            for sm in mldata["stressmodels"].values():
+                for ts in sm.get("stress", []):
+                    self._add_to_series_table(ts, series_table, hashes)
+            data["models"][name] = mldata
+
+        data["series_table"] = series_table
 
         return data
 
-    def _series_to_dict(self, series):
+    def _series_to_dict(self, series, series_table, hashes):
         series = series.to_dict(orient="index")
 
         for name in series.keys():
-            ts = series[name]["series"]
-            series[name]["series"] = ts.dump(series=True)
+            ts = series[name]["series"].dump(series=True)
+            self._add_to_series_table(ts, series_table, hashes)
+            series[name]["series"] = ts
 
         return series
+
+    @staticmethod
+    def _add_to_series_table(ts, series_table, hashes):
+        """Internal method to move the series of a dumped TimeSeries to the
+        series table and replace it with the hash of its content.
+
+        """
+        series = ts.get("series")
+        if not isinstance(series, pd.Series):
+            return
+
+        # Hash every series object only once
+        key = id(series)
+        if key not in hashes:
+            hashes[key] = _get_series_hash(series)
+        series_hash = hashes[key]
+
+        if series_hash not in series_table:
+            series_table[series_hash] = dict(series=series)
+        ts.pop("series")
+        ts["series_hash"] = series_hash
+
+
+def _get_series_hash(series):
+    """Internal method to get a hash of the name, index and values of a
+    series.
+
+    """
+    series_hash = sha1(str(series.name).encode("utf-8"))
+    series_hash.update(pd.util.hash_pandas_object(series).values.tobytes())
+    return series_hash.hexdigest()
@@ -1,4 +1,5 @@
-from .dinoloket import read_dino, DinoGrondwaterstand
+from .cache import set_cache, clear_cache
+from .dinoloket import read_dino, read_dino_dir, DinoGrondwaterstand
 from .knmi import read_knmi, KnmiStation
 from .menyanthes import read_meny, MenyData
 from .waterbase import read_waterbase
@@ -0,0 +1,183 @@
+"""This module contains the on-disk cache for the readers in pastas.read.
+
+The cache is disabled by default. When it is enabled with set_cache, the
+TimeSeries that are returned by read_dino, read_knmi, read_meny and
+read_waterbase are stored in the .npz format in the cache directory. When
+the same file is read again with the same arguments and the file did not
+change (same path, modification time and size), the TimeSeries are loaded
+from the cache instead of parsing the file again.
+
+Examples
+--------
+
+>>> ps.read.set_cache("pastas_cache", max_size=1e9)
+>>> rain = ps.read_knmi("knmi.txt", variables="RD")  # Parses the file
+>>> rain = ps.read_knmi("knmi.txt", variables="RD")  # Loads from the cache
+>>> ps.read.clear_cache("knmi.txt")  # Removes the entries of the file
+
+"""
+
+import json
+import os
+from functools import wraps
+from glob import glob
+from hashlib import sha1
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+# Directory of the cache (None when the cache is disabled) and the maximum
+# total size of the files in the cache in bytes
+_cache_dir = None
+_cache_max_size = None
+
+
+def set_cache(path, max_size=1e9):
+    """Method to enable or disable the on-disk cache of the readers.
+
+    Parameters
+    ----------
+    path: str
+        Directory to store the cache in, which is created when it does not
+        exist. None to disable the cache.
+    max_size: float, optional
+        The maximum total size of the cache in bytes. The least recently
+        used entries are removed when the cache is larger. Default is 1e9.
+
+    """
+    global _cache_dir, _cache_max_size
+    if path is not None:
+        path = os.path.abspath(path)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+    _cache_dir = path
+    _cache_max_size = max_size
+
+
+def clear_cache(fname=None):
+    """Method to remove entries from the cache.
+
+    Parameters
+    ----------
+    fname: str, optional
+        Remove only the entries of this file. Default is None, in which case
+        all entries are removed.
+
+    """
+    if _cache_dir is None:
+        return
+    if fname is None:
+        pattern = "*.npz"
+    else:
+        pattern = _get_file_key(fname) + "_*.npz"
+    for entry in glob(os.path.join(_cache_dir, pattern)):
+        os.remove(entry)
+
+
+def cached(reader):
+    """Decorator that serves the TimeSeries returned by a reader from the
+    cache, when the cache is enabled and the file did not change.
+
+    """
+
+    @wraps(reader)
+    def wrapper(fname, *args, **kwargs):
+        if _cache_dir is None:
+            return reader(fname, *args, **kwargs)
+
+        entry = _get_entry(reader, fname, args, kwargs)
+        if os.path.exists(entry):
+            try:
+                ts = _load_entry(entry)
+                os.utime(entry)  # Mark the entry as recently used
+                return ts
+            except Exception:
+                logger.warning("Cache entry %s for %s could not be loaded and "
+                               "is removed." % (entry, fname))
+                os.remove(entry)
+
+        ts = reader(fname, *args, **kwargs)
+        try:
+            _store_entry(entry, ts)
+            _limit_size()
+        except Exception:
+            logger.warning("The TimeSeries from %s could not be stored in "
+                           "the cache." % fname)
+        return ts
+
+    return wrapper
+
+
+def _get_file_key(fname):
+    """Internal method to get the part of the name of the entries that
+    identifies the file.
+
+    """
+    return sha1(os.path.abspath(fname).encode("utf-8")).hexdigest()[:16]
+
+
+def _get_entry(reader, fname, args, kwargs):
+    """Internal method to get the filename of the cache entry, from the
+    path, modification time and size of the file and the arguments of the
+    reader.
+
+    """
+    stat = os.stat(fname)
+    key = json.dumps([reader.__module__, reader.__name__, stat.st_mtime_ns,
+                      stat.st_size, args, kwargs], sort_keys=True,
+                     default=str)
+    key = sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(_cache_dir, "%s_%s.npz" % (_get_file_key(fname), key))
+
+
+def _store_entry(entry, ts):
+    """Internal method to store the TimeSeries in a cache entry. The entry
+    is written to a temporary file first, so an entry is always complete.
+
+    """
+    from ..io.npz import _write
+
+    data = {"is_list": isinstance(ts, list),
+            "series": [s.dump() for s in ts] if isinstance(ts, list) else
+            [ts.dump()]}
+    temp = "%s.%s.tmp" % (entry, os.getpid())
+    try:
+        with open(temp, "wb") as fo:
+            _write(fo, data)
+        os.replace(temp, entry)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def _load_entry(entry):
+    """Internal method to load the TimeSeries from a cache entry.
+
+    """
+    from ..io.npz import load
+    from ..timeseries import TimeSeries
+
+    data = load(entry)
+    ts = [TimeSeries(**s) for s in data["series"]]
+    if not data["is_list"]:
+        ts = ts[0]
+    return ts
+
+
+def _limit_size():
+    """Internal method to remove the least recently used entries when the
+    cache is larger than the maximum size.
+
+    """
+    if _cache_max_size is None:
+        return
+    entries = []
+    for entry in glob(os.path.join(_cache_dir, "*.npz")):
+        stat = os.stat(entry)
+        entries.append((stat.st_mtime, stat.st_size, entry))
+    size = sum(entry[1] for entry in entries)
+    for _, entry_size, entry in sorted(entries):
+        if size <= _cache_max_size:
+            break
+        os.remove(entry)
+        size -= entry_size
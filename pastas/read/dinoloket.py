@@ -8,12 +8,24 @@ TODO: Get rid of filternummer en opmerking in self.series
 
 from __future__ import print_function, division
 
+import os
+import re
+from functools import partial
+from glob import glob
+from io import StringIO
+
 import numpy as np
 import pandas as pd
 
 from ..timeseries import TimeSeries
+from ..utils import ymd2datetime
+from .cache import cached
+
+# Characters that are removed from the titles of the columns
+_invalid_chars = re.compile(r"[~!@#$%^&*()\-=+\\|\]}\[{';:/?.>,<\"]")
 
 
+@cached
 def read_dino(fname, variable='Stand_cm_tov_NAP', factor=0.01):
     """This method can be used to import files from Dinoloket that contain
      groundwater level measurements (https://www.dinoloket.nl/)
@@ -42,7 +54,7 @@ def read_dino(fname, variable='Stand_cm_tov_NAP', factor=0.01):
     if len(dino.meta) > 0:
         metadata = dino.meta[-1]
     else:
-        metadata = None
+        metadata = dict()
 
     metadata['x'] = dino.x
     metadata['y'] = dino.y
@@ -57,160 +69,272 @@ def read_dino(fname, variable='Stand_cm_tov_NAP', factor=0.01):
     return ts
 
 
+def read_dino_dir(path, variable='Stand_cm_tov_NAP', factor=0.01,
+                  n_jobs=None):
+    """This method can be used to import all files from Dinoloket with
+    groundwater level measurements in a directory.
+
+    Parameters
+    ----------
+    path: str
+        Path to the directory with the Dino files (*.csv).
+    variable: str, optional
+        Name of the variable to import, see read_dino.
+    factor: float, optional
+        Factor to multiply the measurements with, see read_dino.
+    n_jobs: int, optional
+        The number of processes used to read the files, -1 to use all
+        processors. Default is None, in which case the files are read in
+        this process.
+
+    Returns
+    -------
+    ts: dict
+        Dictionary with the file names (without extension) as keys and the
+        Pastas TimeSeries objects as values. The files that can not be
+        read are left out.
+
+    Examples
+    --------
+    >>> oseries = ps.read_dino_dir("dino", n_jobs=-1)
+    >>> mls = ps.Project("dino")
+    >>> for ts in oseries.values():
+    >>>     mls.add_series(ts, kind="oseries")
+
+    """
+    fnames = sorted(glob(os.path.join(path, '*.csv')))
+    read = partial(_read_dino, variable=variable, factor=factor)
+
+    if n_jobs not in (None, 1):
+        from concurrent.futures import ProcessPoolExecutor
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        chunksize = max(1, len(fnames) // (4 * n_jobs))
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            series = list(pool.map(read, fnames, chunksize=chunksize))
+    else:
+        series = map(read, fnames)
+
+    ts = dict()
+    for fname, s in zip(fnames, series):
+        if s is None:
+            print("file", fname, "could not be read")
+        else:
+            name = os.path.splitext(os.path.basename(fname))[0]
+            ts[name] = s
+    return ts
+
+
+def _read_dino(fname, variable='Stand_cm_tov_NAP', factor=0.01):
+    """Internal method to read a Dino file, that returns None when the file
+    can not be read.
+
+    """
+    try:
+        return read_dino(fname, variable=variable, factor=factor)
+    except:
+        return None
+
+
 class DinoGrondwaterstand:
+    """Class to read a csv-file with groundwater levels from Dinoloket.
+
+    Parameters
+    ----------
+    fname: str
+        Filename and path to a Dino file.
+
+    Notes
+    -----
+    The file is read at once and the blocks with the header, the reference
+    levels and the metadata are found first. The block with the
+    measurements is then parsed by pandas.read_csv with explicit dtypes.
+    The columns with the levels are always float64. The column
+    Filternummer is int, or float64 when filter numbers are missing. The
+    attributes from the metadata are empty or NaN when the file has no
+    metadata.
+
+    """
+
     def __init__(self, fname):
         with open(fname, 'r') as f:
-            # lees de header
-            line = f.readline()
-            header = dict()
-            while line not in ['\n', '', '\r\n']:
-                propval = line.split(',')
-                prop = propval[0]
-                prop = prop.replace(':', '')
-                prop = prop.strip()
-                val = propval[1]
-                if propval[2] != '':
-                    val = val + ' ' + propval[2].replace(':', '') + ' ' + \
-                          propval[3]
-                header[prop] = val
-                line = f.readline()
-
-            # lees gat
-            while (line == '\n') or (line == '\r\n'):
-                line = f.readline()
-
-            # lees referentieniveaus
-            ref = dict()
-            while line not in ['\n', '', '\r\n']:
-                propval = line.split(',')
-                prop = propval[0]
-                prop = prop.replace(':', '')
-                prop = prop.strip()
-                if len(propval) > 1:
-                    val = propval[1]
-                    ref[prop] = val
-                line = f.readline()
-
-            # lees gat
-            while (line == '\n') or (line == '\r\n'):
-                line = f.readline()
-
-            # lees meta-informatie
-            metaList = list()
-            line = line.strip()
-            properties = line.split(',')
-            line = f.readline()
-            while line not in ['\n', '', '\r\n']:
-                meta = dict()
-                line = line.strip()
-                values = line.split(',')
-                for i in range(0, len(values)):
-                    meta[properties[i]] = values[i]
-                metaList.append(meta)
-                line = f.readline()
-
-            # lees gat
-            while (line == '\n') or (line == '\r\n'):
-                line = f.readline()
-
-            line = line.strip()
-            titel = line.split(',')
-            while '' in titel:
-                titel.remove('')
-
-            # lees reeksen
-            if line != '':
-                # Validate if titles are valid names
-                validator = np.lib._iotools.NameValidator()
-                titel = validator(titel)
-                dtype = [np.float64] * (len(titel))
-                dtype[0] = "S11"
-                dtype[1] = np.int
-                dtype[2] = "S10"
-                dtype[titel.index('Bijzonderheid')] = object
-                dtype[titel.index('Opmerking')] = object
-                dtype = list(zip(titel, dtype))
-
-                usecols = range(0, len(titel))
-                # # usecols.remove(2)
-                measurements = pd.read_csv(f, header=None, names=titel,
-                                           parse_dates=['Peildatum'],
-                                           index_col='Peildatum',
-                                           dayfirst=True,
-                                           usecols=usecols)
-                ts = measurements['Stand_cm_tov_NAP']
-                #
-                # measurements = np.genfromtxt(f, delimiter=',',
-                #                              dtype=None,
-                #                              usecols=range(0, len(titel)),
-                #                              names=titel,
-                #                              missing_values=[''])
-                # values = measurements['Stand_cm_tov_NAP'] / float(100)
-                # values[values == -0.01] = np.NAN
-
-                # measurements = np.genfromtxt(fname, delimiter=',', dtype=dtype,
-                #                              names=titel, usecols=usecols)
-                # values = measurements['Stand_cm_tov_NAP'] / 100
-
-                # %% zet de ingelezen data om in een reeks
-                # if measurements['Stand_cm_tov_NAP'].dtype == np.dtype('bool'):
-                #     # wanneer bleek dat het allemaal lege waarden waren
-                #     if values.size == 1:
-                #         values = np.NAN
-                #     else:
-                #         values[:] = np.NAN
-
-                # if measurements['Peildatum'].size == 1:
-                #     datum = pd.to_datetime(
-                #         measurements['Peildatum'].item(), dayfirst=True)
-                #     ts = pd.Series([values], [datum])
-                # else:
-                #     datum = pd.to_datetime(measurements['Peildatum'])
-                #     ts = pd.Series(values, datum)
-            else:
-                measurements = None
-                ts = pd.Series()
-
-            # %% kies welke invoer opgeslagen wordt
-            self.meta = metaList
-            if self.meta:
-                self.locatie = self.meta[-1]['Locatie']
-                self.filternummer = int(float(self.meta[-1]['Filternummer']))
-                self.x = float(self.meta[-1]['X-coordinaat'])
-                self.y = float(self.meta[-1]['Y-coordinaat'])
-                meetpunt = self.meta[-1]['Meetpunt (cm t.o.v. NAP)']
-                if meetpunt == '':
-                    self.meetpunt = np.nan
-                else:
-                    self.meetpunt = float(meetpunt) / 100
-                maaiveld = self.meta[-1]['Maaiveld (cm t.o.v. NAP)']
-                if maaiveld == '':
-                    self.maaiveld = np.nan
-                else:
-                    self.maaiveld = float(maaiveld) / 100
-                bovenkant_filter = self.meta[-1][
-                    'Bovenkant filter (cm t.o.v. NAP)']
-                if bovenkant_filter == '':
-                    self.bovenkant_filter = np.nan
-                else:
-                    self.bovenkant_filter = float(bovenkant_filter) / 100
-                self.onderkant_filter = self.meta[-1][
-                    'Onderkant filter (cm t.o.v. NAP)']
-                if self.onderkant_filter == '':
-                    self.onderkant_filter = np.nan
-                else:
-                    self.onderkant_filter = float(self.onderkant_filter) / 100
-            else:
-                # de metadata is leeg
-                self.locatie = ''
-                self.filternummer = np.nan
-                self.x = np.nan
-                self.y = np.nan
-                self.meetpunt = np.nan
-                self.maaiveld = np.nan
-                self.bovenkant_filter = np.nan
-                self.onderkant_filter = np.nan
-            self.data = measurements
-            self.stand = ts
-
-        f.close()
+            text = f.read()
+
+        # lees de header
+        lines, pos = _read_block(text, 0)
+        header = dict()
+        for line in lines:
+            propval = line.split(',')
+            prop = propval[0].replace(':', '').strip()
+            val = propval[1] if len(propval) > 1 else ''
+            if len(propval) > 3 and propval[2] != '':
+                val = val + ' ' + propval[2].replace(':', '') + ' ' + \
+                      propval[3]
+            header[prop] = val
+
+        # lees referentieniveaus
+        lines, pos = _read_block(text, pos)
+        ref = dict()
+        for line in lines:
+            propval = line.split(',')
+            prop = propval[0].replace(':', '').strip()
+            if len(propval) > 1:
+                ref[prop] = propval[1]
+
+        # lees meta-informatie, als die er is
+        lines, pos = _read_block(text, pos, nlines=1)
+        metaList = list()
+        if lines and 'Peildatum' not in lines[0].split(','):
+            properties = lines[0].strip().split(',')
+            if _read_line(text, pos)[0] != '':
+                rows, pos = _read_block(text, pos)
+                for line in rows:
+                    values = line.strip().split(',')
+                    metaList.append(dict(zip(properties, values)))
+
+            # lees de titels van de reeksen, zonder de rest van het bestand
+            lines, pos = _read_block(text, pos, nlines=1)
+
+        # lees reeksen
+        if lines:
+            titel = [_validate_name(name) for name in lines[0].split(',') if
+                     name != '']
+            measurements = pd.read_csv(StringIO(text[pos:]), header=None,
+                                       names=titel,
+                                       usecols=range(len(titel)),
+                                       dtype=_get_dtypes(titel))
+            datum = measurements.pop('Peildatum')
+            try:
+                datum = _parse_dates(datum.values)
+            except (ValueError, UnicodeEncodeError):
+                datum = pd.to_datetime(datum, dayfirst=True)
+            measurements.index = pd.DatetimeIndex(datum, name='Peildatum')
+            if 'Filternummer' in measurements and \
+                    measurements['Filternummer'].notna().all():
+                measurements['Filternummer'] = \
+                    measurements['Filternummer'].astype(int)
+            ts = measurements['Stand_cm_tov_NAP']
+        else:
+            measurements = None
+            ts = pd.Series()
+
+        # %% kies welke invoer opgeslagen wordt
+        self.header = header
+        self.ref = ref
+        self.meta = metaList
+        if self.meta:
+            meta = self.meta[-1]
+            self.locatie = meta.get('Locatie', '')
+            self.filternummer = _to_float(meta.get('Filternummer', ''))
+            if not np.isnan(self.filternummer):
+                self.filternummer = int(self.filternummer)
+            self.x = _to_float(meta.get('X-coordinaat', ''))
+            self.y = _to_float(meta.get('Y-coordinaat', ''))
+            self.meetpunt = _cm_to_m(meta.get('Meetpunt (cm t.o.v. NAP)', ''))
+            self.maaiveld = _cm_to_m(meta.get('Maaiveld (cm t.o.v. NAP)', ''))
+            self.bovenkant_filter = _cm_to_m(
+                meta.get('Bovenkant filter (cm t.o.v. NAP)', ''))
+            self.onderkant_filter = _cm_to_m(
+                meta.get('Onderkant filter (cm t.o.v. NAP)', ''))
+        else:
+            # de metadata is leeg
+            self.locatie = ''
+            self.filternummer = np.nan
+            self.x = np.nan
+            self.y = np.nan
+            self.meetpunt = np.nan
+            self.maaiveld = np.nan
+            self.bovenkant_filter = np.nan
+            self.onderkant_filter = np.nan
+        self.data = measurements
+        self.stand = ts
+
+
+def _read_line(text, pos):
+    """Internal method to read the line that starts at position pos in the
+    text. Returns the line without the line ending and the position of the
+    next line.
+
+    """
+    end = text.find('\n', pos)
+    if end == -1:
+        end = len(text)
+    return text[pos:end].rstrip('\r'), end + 1
+
+
+def _read_block(text, pos, nlines=None):
+    """Internal method to read a block of lines that ends with an empty line,
+    skipping the empty lines before the block. Returns the lines and the
+    position of the line after the block. Only the first nlines lines of
+    the block are read when nlines is not None.
+
+    """
+    lines = []
+    while pos < len(text) and len(lines) != nlines:
+        line, next_pos = _read_line(text, pos)
+        if line == '' and lines:
+            break
+        pos = next_pos
+        if line != '':
+            lines.append(line)
+    return lines, pos
+
+
+def _validate_name(name):
+    """Internal method to make a valid column name from a title, e.g.
+    "Stand_cm_tov_NAP" for "Stand (cm t.o.v. NAP)".
+
+    """
+    return _invalid_chars.sub('', name.strip().replace(' ', '_'))
+
+
+def _get_dtypes(titel):
+    """Internal method to get the dtypes of the columns with measurements.
+
+    """
+    dtypes = dict()
+    for name in titel:
+        if name.startswith('Stand'):
+            dtypes[name] = np.float64
+        elif name in ['Locatie', 'Peildatum', 'Bijzonderheid', 'Opmerking']:
+            dtypes[name] = str
+        elif name == 'Filternummer':
+            # float, as the filter number can be missing, the column is
+            # converted to int when it is not
+            dtypes[name] = np.float64
+    return dtypes
+
+
+def _parse_dates(datum):
+    """Internal method to parse an array of dates in the format dd-mm-yyyy,
+    from the digits of the dates. Raises a ValueError when a date does not
+    have this format or is not a valid date, or a UnicodeEncodeError when a
+    date contains non-ASCII characters.
+
+    """
+    chars = np.array(datum, dtype='S11').view(np.uint8).reshape(-1, 11)
+    digits = chars[:, [0, 1, 3, 4, 6, 7, 8, 9]].astype(np.int64) - ord('0')
+    if (chars[:, [2, 5]] != ord('-')).any() or chars[:, 10].any() or \
+            (digits < 0).any() or (digits > 9).any():
+        raise ValueError('The dates are not in the format dd-mm-yyyy')
+    day = digits[:, 0] * 10 + digits[:, 1]
+    month = digits[:, 2] * 10 + digits[:, 3]
+    year = digits[:, 4:].dot([1000, 100, 10, 1])
+    return ymd2datetime(year, month, day)
+
+
+def _to_float(value):
+    """Internal method to convert a value in the metadata to a float, which
+    is NaN when the value is missing.
+
+    """
+    if value == '':
+        return np.nan
+    return float(value)
+
+
+def _cm_to_m(value):
+    """Internal method to convert a value in cm in the metadata to m.
+
+    """
+    return _to_float(value) / 100
@@ -3,11 +3,21 @@
 
 """
 
+import re
+from io import StringIO
+
+import numpy as np
 import pandas as pd
 
 from ..timeseries import TimeSeries
+from ..utils import ymd2datetime
+from .cache import cached
+
+# The columns of the station table are separated by two or more spaces
+_station_sep = re.compile('  +')
 
 
+@cached
 def read_knmi(fname, variables='RD'):
     """This method can be used to import KNMI data.
 
@@ -24,11 +34,12 @@ def read_knmi(fname, variables='RD'):
         returns a Pastas TimeSeries object or a list of objects.
 
     """
-    knmi = KnmiStation.fromfile(fname)
-    if variables is None:
-        variables = knmi.variables.keys()
     if type(variables) == str:
         variables = [variables]
+    # Only read the requested variables from the file
+    knmi = KnmiStation.fromfile(fname, variables=variables)
+    if variables is None:
+        variables = knmi.variables.keys()
 
     stn_codes = knmi.data['STN'].unique()
 
@@ -36,9 +47,12 @@ def read_knmi(fname, variables='RD'):
     for code in stn_codes:
         for variable in variables:
             if variable not in knmi.data.keys():
+                # Only the requested variables are read, so use the header
+                keys = [key for key in knmi.variables if key not in
+                        ['YYYYMMDD', 'HH']]
                 raise (ValueError(
                     "variable %s is not in this dataset. Please use one of "
-                    "the following keys: %s" % (variable, knmi.data.keys())))
+                    "the following keys: %s" % (variable, keys)))
 
             series = knmi.data.loc[knmi.data['STN'] == code, variable]
             # get rid of the hours when data is daily
@@ -128,10 +142,10 @@ class KnmiStation:
 
     # Alternate constructor
     @classmethod
-    def fromfile(cls, fname):
+    def fromfile(cls, fname, variables=None):
         self = cls()
         with open(fname, 'r') as f:
-            self.readdata(f)
+            self.readdata(f, variables=variables)
         f.close()
 
         return self
@@ -190,15 +204,18 @@ class KnmiStation:
         f = StringIO(self.result)
         self.readdata(f)
 
-    def readdata(self, f):
+    def _read_header(self, lines):
+        """Internal method to read the station table and the descriptions of
+        the variables from the lines of the header.
+
+        """
         isLocations = False
-        line = f.readline()
-        isMeteo = line.startswith('# ')
+        isMeteo = bool(lines) and lines[0].startswith('# ')
+        titels = None
+        stations = []
 
-        # Process the header information (Everything < 'STN,')
-        while 'STN,' not in line:
+        for line in lines:
             # Pre-format the line
-            line = line.strip('\n')
             line = line.lstrip('# ')
 
             # If line is empty, skipline
@@ -207,16 +224,9 @@ class KnmiStation:
             # If line contains station info (can only happen for meteorological stations)
             elif isMeteo and line.startswith('STN '):
                 isLocations = True
-                line = line.strip()
-                titels = line.split()
-                titels = [x.replace('(', '_') for x in titels]
-                titels = [x.replace(r')', '') for x in titels]
-
-                # Create pd.DataFrame for station data
-                if not self.stations:
-                    self.stations = pd.DataFrame(columns=titels)
-                    self.stations.set_index(['STN'], inplace=True)
-
+                titels = line.strip().split()
+                titels = [x.replace('(', '_').replace(')', '') for x in
+                          titels]
             # If line contains variables
             elif ' = ' in line:
                 isLocations = False
@@ -224,58 +234,66 @@ class KnmiStation:
                 self.variables[varDes[0].strip()] = varDes[1].strip()
             # If location data is recognized in the previous line
             elif isLocations:
-                # Format line. Ensure delimiter is two spaces to read the
-                # location correctly
-                line = line.strip()
-                line = line.replace(':', '')
-                line = line.replace('         ', '  ')
-                line = line.replace('        ', '  ')
-                line = line.replace('       ', '  ')
-                line = line.replace('      ', '  ')
-                line = line.replace('     ', '  ')
-                line = line.replace('    ', '  ')
-                line = line.replace('   ', '  ')
-                # Add station location data
-                line = line.split('  ')
-                stn = int(line[0])
-
-                def maybe_float(s):
-                    try:
-                        return float(s)
-                    except (ValueError, TypeError):
-                        return s
-
-                line = [maybe_float(v) for v in line[1:]]
-                self.stations.loc[stn] = line
-
-            # Read in a new line and start over
-            line = f.readline()
+                # The columns are separated by two or more spaces, the name
+                # of the station can contain single spaces
+                line = _station_sep.split(line.strip().replace(':', ''))
+                stations.append([int(line[0])] +
+                                [_maybe_float(v) for v in line[1:]])
+
+        if titels is not None:
+            self.stations = pd.DataFrame(stations, columns=titels)
+            self.stations.set_index(['STN'], inplace=True)
+
+    def readdata(self, f, variables=None):
+        """Method to read the data from a file object with KNMI data.
+
+        Parameters
+        ----------
+        f: file object
+            File object with the KNMI data, that is read and closed.
+        variables: list of str, optional
+            Names of the variables to read. Default is None, in which case
+            all variables are read.
+
+        Notes
+        -----
+        The header is scanned once for the station table, the descriptions
+        of the variables and the line with the column names ('STN,'). The
+        data block is then parsed by pandas.read_csv with the C engine.
+
+        """
+        text = f.read()
+
+        # Find the line with the column names of the datablock
+        start = text.find('STN,')
+        start = text.rfind('\n', 0, start) + 1
+        end = text.find('\n', start)
+        if end == -1:
+            end = len(text)
+
+        # Process the header information (Everything < 'STN,')
+        self._read_header(text[:start].splitlines())
 
         # The header information of the datablock
-        line = line.strip('\n')
-        line = line.lstrip('# ')
-        header = line.split(',')
-        header = [item.lstrip().rstrip() for item in header]
-        pos = f.tell()
-        line = f.readline()  # Skip empty line after header
-        if line not in ["\n", "\r\n", "# \n", '# \r\n']:
-            # sometimes there is no empty line between the header and the data
-            f.seek(pos)
-        # Process the datablock
-        if False:
-            # older method, is much slower
-            string2datetime = lambda x: pd.to_datetime(x, format='%Y%m%d')
-
-            data = pd.read_csv(f, header=None, names=header,
-                               parse_dates=['YYYYMMDD'], index_col='YYYYMMDD',
-                               na_values='     ',
-                               converters={1: string2datetime})
+        line = text[start:end].strip().lstrip('# ')
+        header = [item.strip() for item in line.split(',')]
+
+        if variables is None:
+            usecols = [item for item in header if item != '']
         else:
-            # newer method, calculating the date afterwards is much faster
-            data = pd.read_csv(f, header=None, names=header, na_values='     ')
-            data.set_index(pd.to_datetime(data.YYYYMMDD, format='%Y%m%d'),
-                           inplace=True)
-            data = data.drop('YYYYMMDD', axis=1)
+            usecols = [item for item in header if item in
+                       ['STN', 'YYYYMMDD', 'HH'] or item in variables]
+        dtype = {item: np.float64 for item in usecols}
+        dtype.update({item: np.int64 for item in ['STN', 'YYYYMMDD', 'HH']})
+
+        # Process the datablock, lines with a # (the empty line after the
+        # header in some files) are skipped
+        skiprows = text.count('\n', 0, end) + 1
+        data = pd.read_csv(StringIO(text), skiprows=skiprows, header=None,
+                           names=header, usecols=usecols, dtype=dtype,
+                           na_values='     ', comment='#', engine='c')
+        data.index = _get_dates(data.pop('YYYYMMDD').values)
+        data.index.name = 'YYYYMMDD'
 
         # convert the hours if provided
         if 'HH' in data.keys():
@@ -284,7 +302,7 @@ class KnmiStation:
             data.pop('HH')
         else:
             # daily data
-            if 'RD' in data.keys():
+            if 'RD' in header:
                 # daily precipitation amount in 0.1 mm over the period 08.00 preceding day - 08.00 UTC present day
                 data.index = data.index + pd.to_timedelta(8, unit='h')
             else:
@@ -294,16 +312,15 @@ class KnmiStation:
         # from UT to UT+1 (standard-time in the Netherlands)
         data.index = data.index + pd.to_timedelta(1, unit='h')
 
-        # Delete empty columns
-        if '' in data.columns:
-            data.drop('', axis=1, inplace=True)
-
         # Adjust the unit of the measurements
-        for key, value in self.variables.items():
+        for key, value in list(self.variables.items()):
             # test if key existst in data
             if key not in data.keys():
                 if key == 'YYYYMMDD' or key == 'HH':
                     pass
+                elif variables is not None and key not in variables:
+                    # this variable is not read
+                    continue
                 elif key == 'T10N':
                     self.variables.pop(key)
                     key = 'T10'
@@ -346,3 +363,22 @@ class KnmiStation:
         f.close()
 
         self.data = data
+
+
+def _get_dates(yyyymmdd):
+    """Internal method to get the dates from an array of integers with the
+    format yyyymmdd.
+
+    """
+    try:
+        return ymd2datetime(yyyymmdd // 10000, yyyymmdd // 100 % 100,
+                            yyyymmdd % 100)
+    except ValueError:
+        return pd.to_datetime(yyyymmdd.astype(str), format='%Y%m%d')
+
+
+def _maybe_float(s):
+    try:
+        return float(s)
+    except (ValueError, TypeError):
+        return s
@@ -17,14 +17,15 @@ from os import path
 
 import numpy as np
 from pandas import Series, offsets
-from scipy.io import loadmat
 
 from ..timeseries import TimeSeries
 from ..utils import matlab2datetime
+from .cache import cached
 
 
+@cached
 def read_meny(fname, locations=None, type='H'):
-    meny = MenyData(fname, data=type)
+    meny = MenyData(fname, data=type, locations=locations)
     if type == 'H':
         data = meny.H
     elif type == 'IN':
@@ -67,55 +68,63 @@ def read_meny(fname, locations=None, type='H'):
 
 
 class MenyData:
-    def __init__(self, fname, data='all'):
+    def __init__(self, fname, data='all', locations=None):
         """This class reads a menyanthes file.
 
         Parameters
         ----------
         fname: str
             String with the filename and path to a menyanthes file.
-
+        data: str or list of str, optional
+            The parts of the file to read: 'H', 'IN', 'M' or 'all' (default).
+            The other parts are not read from the file.
+        locations: list of str, optional
+            The names of the locations to read. Default is None, in which
+            case all locations are read.
 
         """
 
-        mat = self.read_file(fname)
-
         # Figure out which data to collect from the file.
         if data == 'all':
             data = ['H', 'IN', 'M']
         elif type(data) is str:
             data = [data]
 
+        mat = self.read_file(fname, variable_names=data)
+
         if 'IN' in data:
             self.IN = dict()
-            self.read_in(mat)
+            self.read_in(mat, locations=locations)
 
         if 'H' in data:
             self.H = dict()
-            self.read_h(mat)
+            self.read_h(mat, locations=locations)
 
         if 'M' in data:
             self.M = dict()
-            self.read_m(mat)
+            self.read_m(mat, locations=locations)
 
         del mat  # Delete the mat file from memory again
 
-    def read_file(self, fname):
-        """This method is used to read the file.
+    def read_file(self, fname, variable_names=None):
+        """This method is used to read the file. Only the variables in
+        variable_names (e.g. ['H']) are read when it is not None.
 
         """
+        from scipy.io import loadmat
 
         # Check if file is present
         if not (path.isfile(fname)):
             print('Could not find file ', fname)
 
         mat = loadmat(fname, struct_as_record=False, squeeze_me=True,
-                      chars_as_strings=True)
+                      chars_as_strings=True, variable_names=variable_names)
 
         return mat
 
-    def read_in(self, mat):
-        """Read the input part.
+    def read_in(self, mat, locations=None):
+        """Read the input part, only for the locations in locations when it
+        is not None.
 
         """
 
@@ -125,14 +134,20 @@ class MenyData:
 
         # Read all the time series models
         for i, IN in enumerate(mat['IN']):
+            if not hasattr(IN, 'Name') and not hasattr(IN, 'name'):
+                IN.Name = 'IN' + str(i)
+            if hasattr(IN, 'name'):
+                IN.Name = IN.name
+            if locations is not None and IN.Name not in locations:
+                continue
+
             data = dict()
 
             for name in IN._fieldnames:
                 if name != 'values':
                     data[name] = getattr(IN, name)
                 else:
-                    tindex = [matlab2datetime(tval) for tval in
-                              IN.values[:, 0]]
+                    tindex = matlab2datetime(IN.values[:, 0])
                     series = Series(IN.values[:, 1], index=tindex)
 
                     # round on seconds, to get rid of conversion milliseconds
@@ -143,7 +158,7 @@ class MenyData:
                         # time-step, so divide by the timestep now
                         step = series.index.to_series().diff() / offsets.Day(
                             1)
-                        step = step.values.astype(np.float)
+                        step = step.values.astype(float)
                         series = series / step
                         if series.values[0] != 0:
                             series = series[1:]
@@ -151,15 +166,11 @@ class MenyData:
                     data['values'] = series
 
             # add to self.IN
-            if not hasattr(IN, 'Name') and not hasattr(IN, 'name'):
-                IN.Name = 'IN' + str(i)
-            if hasattr(IN, 'name'):
-                IN.Name = IN.name
-
             self.IN[IN.Name] = data
 
-    def read_h(self, mat):
-        """Read the dependent variable part.
+    def read_h(self, mat, locations=None):
+        """Read the dependent variable part, only for the locations in
+        locations when it is not None.
 
         """
 
@@ -169,14 +180,22 @@ class MenyData:
 
         # Read all the time series models
         for i, H in enumerate(mat['H']):
+            if not hasattr(H, 'Name') and not hasattr(H, 'name'):
+                H.Name = 'H' + str(i)  # Give it the index name
+            if hasattr(H, 'name'):
+                H.Name = H.name
+            if len(H.Name) == 0:
+                H.Name = H.tnocode
+            if locations is not None and H.Name not in locations:
+                continue
+
             data = dict()
 
             for name in H._fieldnames:
                 if name != 'values':
                     data[name] = getattr(H, name)
                 else:
-                    tindex = [matlab2datetime(tval) for tval in
-                              H.values[:, 0]]
+                    tindex = matlab2datetime(H.values[:, 0])
                     # measurement is used as is
                     series = Series(H.values[:, 1], index=tindex)
                     # round on seconds, to get rid of conversion milliseconds
@@ -184,17 +203,11 @@ class MenyData:
                     data['values'] = series
 
             # add to self.H
-            if not hasattr(H, 'Name') and not hasattr(H, 'name'):
-                H.Name = 'H' + str(i)  # Give it the index name
-            if hasattr(H, 'name'):
-                H.Name = H.name
-            if len(H.Name) == 0:
-                H.Name = H.tnocode
-
             self.H[H.Name] = data
 
-    def read_m(self, mat):
-        """Read the result part.
+    def read_m(self, mat, locations=None):
+        """Read the result part, only for the locations in locations when it
+        is not None.
 
         """
         # Check if more then one time series model is present
@@ -203,24 +216,25 @@ class MenyData:
 
         # Read all the time series models
         for i, M in enumerate(mat['M']):
+            if not hasattr(M, 'Name') and not hasattr(M, 'name'):
+                M.Name = 'M' + str(i)  # Give it the index name
+            if hasattr(M, 'name'):
+                M.Name = M.name
+            if locations is not None and M.Name not in locations:
+                continue
+
             data = dict()
 
             for name in M._fieldnames:
                 if name != 'values':
                     data[name] = getattr(M, name)
                 else:
-                    tindex = [matlab2datetime(tval) for tval in
-                              M.values[:, 0]]
+                    tindex = matlab2datetime(M.values[:, 0])
                     # measurement is used as is
                     series = Series(M.values[:, 1], index=tindex)
                     # round on seconds, to get rid of conversion milliseconds
                     series.index = series.index.round('s')
                     data['values'] = series
 
-            # add to self.H
-            if not hasattr(M, 'Name') and not hasattr(M, 'name'):
-                M.Name = 'M' + str(i)  # Give it the index name
-            if hasattr(M, 'name'):
-                M.Name = M.name
-
+            # add to self.M
             self.M[M.Name] = data
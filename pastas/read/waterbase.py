@@ -6,22 +6,42 @@ Author: R.A. Collenteur, Artesia Water 2017
 
 """
 
-from pandas import read_csv
+import numpy as np
+from pandas import read_csv, concat, to_datetime, to_timedelta
 
 from ..timeseries import TimeSeries
+from ..utils import ymd2datetime
+from .cache import cached
 
 
+@cached
 def read_waterbase(fname, locations=None, variable="NUMERIEKEWAARDE",
-                   kind="waterlevel", freq="10min", units="cm"):
+                   kind="waterlevel", freq="10min", units="cm",
+                   chunksize=100000, encoding="ISO-8859-1"):
     """Method to import waterlevel ts from waterbase.
 
     Parameters
     ----------
     fname: str
         string with the path and filename of the waterbase file.
+    locations: str or list of str, optional
+        name(s) of the location(s) to import. Default is None, in which case
+        all locations are imported.
     variable: str
         name of the variable to collect the time series from. Only one
         variable name is allowed.
+    kind: str, optional
+        settings of the TimeSeries, default is "waterlevel".
+    freq: str, optional
+        frequency of the measurements, default is "10min".
+    units: str, optional
+        units of the measurements that are stored in the metadata, default
+        is "cm".
+    chunksize: int, optional
+        number of lines that are read at once. Default is 100000.
+    encoding: str, optional
+        encoding of the file, default is "ISO-8859-1" (the encoding of the
+        files from WaterInfo).
 
     Returns
     -------
@@ -36,30 +56,64 @@ def read_waterbase(fname, locations=None, variable="NUMERIEKEWAARDE",
     the xy-coordinates are calculates as the mean xy-coordinate in case these
     values are not unique.
 
+    The file is read in chunks of chunksize lines, and only the lines of
+    the requested locations are kept in memory, so large files can be
+    imported.
+
     """
-    ts = []
-    df = read_csv(fname, delimiter=";", index_col="Date", decimal=",",
-                  usecols=["MEETPUNT_IDENTIFICATIE", "WAARNEMINGDATUM",
-                           "WAARNEMINGTIJD", variable, "EPSG", "X", "Y"],
-                  parse_dates={"Date": ["WAARNEMINGDATUM", "WAARNEMINGTIJD"]},
-                  infer_datetime_format=True, dayfirst=True,
-                  na_values=[-999999999, 999999999])
+    if type(locations) == str:
+        locations = [locations]
+
+    reader = read_csv(fname, delimiter=";", decimal=",",
+                      usecols=["MEETPUNT_IDENTIFICATIE", "WAARNEMINGDATUM",
+                               "WAARNEMINGTIJD", variable, "EPSG", "X", "Y"],
+                      dtype={"MEETPUNT_IDENTIFICATIE": str,
+                             "WAARNEMINGDATUM": str, "WAARNEMINGTIJD": str,
+                             variable: np.float64, "EPSG": str,
+                             "X": np.float64, "Y": np.float64},
+                      na_values=[-999999999, 999999999], chunksize=chunksize,
+                      encoding=encoding)
+
+    # Collect the measurements and the coordinates per location
+    data = dict()
+    for df in reader:
+        if locations is not None:
+            df = df.loc[df["MEETPUNT_IDENTIFICATIE"].isin(locations)]
+        df.index = _get_dates(df.pop("WAARNEMINGDATUM").values,
+                              df.pop("WAARNEMINGTIJD").values)
+
+        groups = df.groupby("MEETPUNT_IDENTIFICATIE", sort=False)
+        xy = groups[["X", "Y"]].agg(["sum", "count"])
+        epsg = groups["EPSG"].first()
+        for name, series in groups[variable]:
+            if name not in data:
+                data[name] = {"series": [], "x": 0.0, "y": 0.0, "nx": 0,
+                              "ny": 0, "epsg": epsg[name]}
+            loc = data[name]
+            loc["series"].append(series)
+            loc["x"] += xy.at[name, ("X", "sum")]
+            loc["nx"] += xy.at[name, ("X", "count")]
+            loc["y"] += xy.at[name, ("Y", "sum")]
+            loc["ny"] += xy.at[name, ("Y", "count")]
 
     if locations is None:
-        locations = df.MEETPUNT_IDENTIFICATIE.unique()
-    elif type(locations) == str:
-        locations = [locations]
+        locations = data.keys()
 
+    ts = []
     for name in locations:
-        series = df.loc[df["MEETPUNT_IDENTIFICATIE"].isin([name])]
+        if name not in data:
+            raise ValueError("location %s is not in this dataset. Please use "
+                             "one of the following locations: %s" %
+                             (name, list(data.keys())))
+        loc = data[name]
         metadata = {
-            "x": series.X.mean(),
-            "y": series.Y.mean(),
+            "x": loc["x"] / loc["nx"] if loc["nx"] else np.nan,
+            "y": loc["y"] / loc["ny"] if loc["ny"] else np.nan,
             "z": 0,
-            "projection": "epsg:" + str(series.loc[:, "EPSG"].unique()[0]),
-            "units": "cm"
+            "projection": "epsg:" + str(loc["epsg"]),
+            "units": units
         }
-        series = series.loc[:, variable].sort_index()
+        series = concat(loc["series"]).sort_index()
         ts.append(TimeSeries(series, name=name, metadata=metadata,
                              settings=kind, freq_original=freq))
 
@@ -67,3 +121,29 @@ def read_waterbase(fname, locations=None, variable="NUMERIEKEWAARDE",
         ts = ts[0]
 
     return ts
+
+
+def _get_dates(datum, tijd):
+    """Internal method to get the dates from the arrays with the dates
+    (dd-mm-yyyy) and the times (hh:mm:ss), from the digits of the dates and
+    times. Falls back to pandas.to_datetime for other formats.
+
+    """
+    try:
+        dchars = np.array(datum, dtype="S11").view(np.uint8).reshape(-1, 11)
+        tchars = np.array(tijd, dtype="S9").view(np.uint8).reshape(-1, 9)
+        if dchars[:, 10].any() or tchars[:, 8].any() or \
+                (dchars[:, [2, 5]] != ord("-")).any() or \
+                (tchars[:, [2, 5]] != ord(":")).any():
+            raise ValueError("The dates are not in the format dd-mm-yyyy")
+        d = dchars[:, [0, 1, 3, 4, 6, 7, 8, 9]].astype(np.int64) - ord("0")
+        t = tchars[:, [0, 1, 3, 4, 6, 7]].astype(np.int64) - ord("0")
+        if (d < 0).any() or (d > 9).any() or (t < 0).any() or (t > 9).any():
+            raise ValueError("The dates are not in the format dd-mm-yyyy")
+        dates = ymd2datetime(d[:, 4:].dot([1000, 100, 10, 1]),
+                             d[:, 2:4].dot([10, 1]), d[:, :2].dot([10, 1]))
+        seconds = t.dot([36000, 3600, 600, 60, 10, 1])
+        return dates + to_timedelta(seconds, unit="s")
+    except (ValueError, UnicodeEncodeError):
+        return to_datetime([" ".join(x) for x in zip(datum, tijd)],
+                           dayfirst=True)
@@ -21,9 +21,10 @@ TODO
 """
 
 import numpy as np
-from pandas import DataFrame
 from scipy.special import gammainc, gammaincinv, k0, exp1, erfc, lambertw
 
+from .parameters import create_parameters
+
 __all__ = ["Gamma", "Exponential", "Hantush", "One"]
 
 
@@ -131,18 +132,16 @@ class Gamma(RfuncBase):
         self.nparam = 3
 
     def set_parameters(self, name):
-        parameters = DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
         if self.up:
-            parameters.loc[name + '_A'] = (1 / self.meanstress, 0,
-                                           100 / self.meanstress, 1, name)
+            rows = [(name + '_A', 1 / self.meanstress, 0,
+                     100 / self.meanstress, 1, name)]
         else:
-            parameters.loc[name + '_A'] = (-1 / self.meanstress,
-                                           -100 / self.meanstress, 0, 1, name)
+            rows = [(name + '_A', -1 / self.meanstress,
+                     -100 / self.meanstress, 0, 1, name)]
         # if n is too small, the length of the response function is close to zero
-        parameters.loc[name + '_n'] = (1, 0.1, 10, 1, name)
-        parameters.loc[name + '_a'] = (10, 0.01, 5000, 1, name)
-        return parameters
+        rows.append((name + '_n', 1, 0.1, 10, 1, name))
+        rows.append((name + '_a', 10, 0.01, 5000, 1, name))
+        return create_parameters(rows)
 
     def get_tmax(self, p, cutoff=None):
         if cutoff is None:
@@ -190,16 +189,14 @@ class Exponential(RfuncBase):
         self.nparam = 2
 
     def set_parameters(self, name):
-        parameters = DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
         if self.up:
-            parameters.loc[name + '_A'] = (
-                1 / self.meanstress, 0, 100 / self.meanstress, 1, name)
+            rows = [(name + '_A', 1 / self.meanstress, 0,
+                     100 / self.meanstress, 1, name)]
         else:
-            parameters.loc[name + '_A'] = (
-                -1 / self.meanstress, -100 / self.meanstress, 0, 1, name)
-        parameters.loc[name + '_a'] = (10, 0.01, 5000, 1, name)
-        return parameters
+            rows = [(name + '_A', -1 / self.meanstress,
+                     -100 / self.meanstress, 0, 1, name)]
+        rows.append((name + '_a', 10, 0.01, 5000, 1, name))
+        return create_parameters(rows)
 
     def get_tmax(self, p, cutoff=None):
         if cutoff is None:
@@ -259,17 +256,15 @@ class Hantush(RfuncBase):
         self.nparam = 3
 
     def set_parameters(self, name):
-        parameters = DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
         if self.up:
-            parameters.loc[name + '_A'] = (
-                1 / self.meanstress, 0, 100 / self.meanstress, 1, name)
+            rows = [(name + '_A', 1 / self.meanstress, 0,
+                     100 / self.meanstress, 1, name)]
         else:
-            parameters.loc[name + '_A'] = (
-                -1 / self.meanstress, -100 / self.meanstress, 0, 1, name)
-        parameters.loc[name + '_rho'] = (1, 0.0001, 10, 1, name)
-        parameters.loc[name + '_cS'] = (100, 1e-3, 1e3, 1, name)
-        return parameters
+            rows = [(name + '_A', -1 / self.meanstress,
+                     -100 / self.meanstress, 0, 1, name)]
+        rows.append((name + '_rho', 1, 0.0001, 10, 1, name))
+        rows.append((name + '_cS', 100, 1e-3, 1e3, 1, name))
+        return create_parameters(rows)
 
     def get_tmax(self, p, cutoff=None):
         # approximate formula for tmax
@@ -331,12 +326,10 @@ class Theis(RfuncBase):
         self.nparam = 3
 
     def set_parameters(self, name):
-        parameters = DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
-        parameters.loc[name + '_S'] = (0.25, 1e-3, 1.0, 1, name)
-        parameters.loc[name + '_T'] = (100.0, 0.0, 10000.0, 1, name)
-        parameters.loc[name + '_r'] = (1000.0, 0.0, 100000.0, 0, name)
-        return parameters
+        rows = [(name + '_S', 0.25, 1e-3, 1.0, 1, name),
+                (name + '_T', 100.0, 0.0, 10000.0, 1, name),
+                (name + '_r', 1000.0, 0.0, 100000.0, 0, name)]
+        return create_parameters(rows)
 
     def gain(self, p):
         return self.up * np.inf
@@ -374,18 +367,16 @@ class Bruggeman(RfuncBase):
         self.nparam = 3
 
     def set_parameters(self, name):
-        parameters = DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
         a_init = 1
         b_init = 0.1
         c_init = 1 / np.exp(-2 * a_init) / self.meanstress
-        parameters.loc[name + '_a'] = (a_init, 0, 100, 1, name)
-        parameters.loc[name + '_b'] = (b_init, 0, 10, 1, name)
+        rows = [(name + '_a', a_init, 0, 100, 1, name),
+                (name + '_b', b_init, 0, 10, 1, name)]
         if self.up:
-            parameters.loc[name + '_c'] = (c_init, 0, c_init * 100, 1, name)
+            rows.append((name + '_c', c_init, 0, c_init * 100, 1, name))
         else:
-            parameters.loc[name + '_c'] = (-c_init, -c_init * 100, 0, 1, name)
-        return parameters
+            rows.append((name + '_c', -c_init, -c_init * 100, 0, 1, name))
+        return create_parameters(rows)
 
     def get_tmax(self, p, cutoff=None):
         # TODO: find tmax from cutoff, below is just an opproximation
@@ -421,13 +412,11 @@ class One(RfuncBase):
         self.nparam = 1
 
     def set_parameters(self, name):
-        parameters = DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
         if self.up:
-            parameters.loc[name + '_d'] = (1, 0, 100, 1, name)
+            rows = [(name + '_d', 1, 0, 100, 1, name)]
         else:
-            parameters.loc[name + '_d'] = (-1, -100, 0, 1, name)
-        return parameters
+            rows = [(name + '_d', -1, -100, 0, 1, name)]
+        return create_parameters(rows)
 
     def gain(self, p):
         return p[0]
@@ -32,7 +32,6 @@ from __future__ import print_function, division
 
 import numpy as np
 import pandas as pd
-from scipy.stats import chi2, norm
 
 from pastas.decorators import model_tmin_tmax
 from .utils import get_sample
@@ -567,6 +566,8 @@ def ljung_box(series, tmin=None, tmax=None, n_params=5, alpha=None, **kwargs):
     Series Models", Biometrika, 65, 297-303.
 
     """
+    from scipy.stats import chi2
+
     r = acf(series, tmin=tmin, tmax=tmax, **kwargs)
     r = r.drop(0)  # Drop zero-lag from the acf
 
@@ -601,6 +602,8 @@ def runs_test(series, tmin=None, tmax=None, cutoff="mean"):
     pval: float
 
     """
+    from scipy.stats import norm
+
     # Make dichotomous sequence
     R = series.copy()
     if cutoff == "mean":
@@ -26,11 +26,12 @@ from logging import getLogger
 
 import numpy as np
 import pandas as pd
-from scipy.signal import fftconvolve
 
 from .decorators import set_parameter
+from .parameters import create_parameters
 from .rfunc import One
 from .timeseries import TimeSeries
+from .utils import convolve, overlap_save
 
 logger = getLogger(__name__)
 
@@ -55,14 +56,26 @@ class StressModelBase:
 
     def __init__(self, rfunc, name, tmin, tmax, up, meanstress, cutoff):
         self.rfunc = rfunc(up, meanstress, cutoff)
-        self.parameters = pd.DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
+        self.parameters = create_parameters()
         self.nparam = self.rfunc.nparam
         self.name = name
         self.tmin = tmin
         self.tmax = tmax
         self.freq = None
         self.stress = []
+        self._warmup_means = (None, None)
+        self._block = (None, None)
+
+    def __getstate__(self):
+        """Method to get the state of the stressmodel for pickling, without
+        the cached means of the stresses over the warmup period and the
+        cached block response.
+
+        """
+        state = self.__dict__.copy()
+        state["_warmup_means"] = (None, None)
+        state["_block"] = (None, None)
+        return state
 
     def set_init_parameters(self):
         """Set the initial parameters (back) to their default values.
@@ -133,6 +146,163 @@ class StressModelBase:
         if "freq" in kwargs:
             self.freq = kwargs["freq"]
 
+    def steady_state(self, p, index, freq, dt, warmup, istress=None):
+        """Method to approximate the contribution of the stress before the
+        start of the simulation.
+
+        Parameters
+        ----------
+        p: 1D array
+           Parameters used for simulation.
+        index: pandas.DatetimeIndex
+            Index of the simulation, starting at tmin.
+        freq: str
+        dt: float
+        warmup: int
+            Length of the period before tmin in days that is used to
+            compute the mean stress.
+        istress: int, optional
+
+        Returns
+        -------
+        pandas.Series or None
+            The contribution of the stress before tmin, or None if the
+            stressmodel has no memory.
+
+        Notes
+        -----
+        The stress before tmin is assumed to be constant and equal to the
+        mean stress over the warmup period. The contribution of this
+        stress is the mean stress times the remaining part of the step
+        response, so the warmup period does not have to be simulated.
+        Stressmodels that return a steady state accept the tstart argument
+        in simulate, to leave out the stress before tmin.
+
+        """
+        return None
+
+    def get_warmup_means(self, tmin, freq, warmup):
+        """Internal method to get the mean of each stress over the warmup
+        period before tmin. The means are stored, so they are only computed
+        again when tmin, freq or warmup change.
+
+        Notes
+        -----
+        The means are computed from the validated series in the warmup
+        period, changed to freq with the settings of the stress, so the
+        series of the stress itself is not updated. When there is no stress
+        in the warmup period, the fill_before setting of the stress is used.
+
+        """
+        key = (pd.Timestamp(tmin), freq, warmup)
+        if self._warmup_means[0] != key:
+            tmin_warm = key[0] - pd.DateOffset(days=warmup)
+            self.update_stress(freq=freq)
+            means = []
+            for stress in self.stress:
+                series = stress.series_validated
+                series = series[(series.index >= tmin_warm) &
+                                (series.index < key[0])]
+                mean = np.nan
+                if not series.empty:
+                    series = stress.change_frequency(series.copy())
+                    mean = stress.normalize(series).mean()
+                if np.isnan(mean):
+                    fill_before = stress.settings["fill_before"]
+                    if fill_before == "mean":
+                        mean = stress.series.mean()
+                    elif isinstance(fill_before, float):
+                        mean = fill_before
+                    else:
+                        mean = 0.0
+                means.append(mean)
+            self._warmup_means = (key, means)
+        return self._warmup_means[1]
+
+    def get_block(self, p, dt):
+        """Internal method to get the block response. The last block
+        response is stored, so it is only computed once when the stresses
+        and the steady state are simulated separately for the same
+        parameters.
+
+        """
+        key = (np.asarray(p).tobytes(), dt, self.rfunc.cutoff)
+        if self._block[0] != key:
+            self._block = (key, self.rfunc.block(p, dt))
+        return self._block[1]
+
+    def get_steady_state(self, b, mean, index):
+        """Internal method to compute the contribution of a constant stress
+        with value mean before the first value of index, using block
+        response b.
+
+        """
+        h = np.zeros(index.size)
+        n = min(b.size, index.size)
+        h[:n] = mean * (b.sum() - b.cumsum()[:n])
+        return pd.Series(data=h, index=index, name=self.name, fastpath=True)
+
+    def simulate_chunks(self, p, tindex, freq=None, dt=1, chunksize=100000,
+                        tstart=None):
+        """Generator that yields the contribution in chunks.
+
+        Parameters
+        ----------
+        p: 1D array
+           Parameters used for simulation.
+        tindex: pandas.DatetimeIndex
+            Index of the simulation. The chunks are taken from this index.
+        freq: str, optional
+        dt: float, optional
+        chunksize: int, optional
+            Number of time steps of tindex in each chunk.
+        tstart: pandas.Timestamp, optional
+            Leave out the stress before tstart, see simulate.
+
+        Yields
+        ------
+        pandas.Series
+            The simulated head contribution for the time steps of each
+            chunk of tindex.
+
+        Notes
+        -----
+        This basic method simulates the contribution at once and splits
+        the result. Stressmodels with a convolution compute each chunk
+        separately, so the memory needed is bounded by the chunksize.
+
+        """
+        if tstart is None:
+            h = self.simulate(p, tindex[0], tindex[-1], freq, dt)
+        else:
+            h = self.simulate(p, tindex[0], tindex[-1], freq, dt,
+                              tstart=tstart)
+        for index, i0, i1 in self.get_chunks(h.index, tindex, chunksize):
+            yield h.iloc[i0:i1]
+
+    @staticmethod
+    def get_chunks(index, tindex, chunksize):
+        """Internal generator that yields the positions in index that belong
+        to each chunk of tindex.
+
+        """
+        for k in range(0, tindex.size, chunksize):
+            tchunk = tindex[k:k + chunksize]
+            i0 = index.searchsorted(tchunk[0], side="left")
+            i1 = index.searchsorted(tchunk[-1], side="right")
+            yield index[i0:i1], i0, i1
+
+    def convolve_chunks(self, stress, b, tindex, chunksize):
+        """Internal generator that yields the convolution of the stress and
+        the block response for each chunk of tindex.
+
+        """
+        x = stress.values
+        for index, i0, i1 in self.get_chunks(stress.index, tindex,
+                                             chunksize):
+            yield pd.Series(data=overlap_save(x, b, i0, i1), index=index,
+                            name=self.name, fastpath=True)
+
     def handle_stress(self, stress, settings):
         """Method to handle user provided stress in init
 
@@ -282,7 +452,8 @@ class StressModel(StressModelBase):
         """
         self.parameters = self.rfunc.set_parameters(self.name)
 
-    def simulate(self, p, tmin=None, tmax=None, freq=None, dt=1):
+    def simulate(self, p, tmin=None, tmax=None, freq=None, dt=1,
+                 tstart=None):
         """Simulates the head contribution.
 
         Parameters
@@ -292,6 +463,9 @@ class StressModel(StressModelBase):
         tmin: str, optional
         tmax: str, optional
         freq: str, optional
+        tstart: pandas.Timestamp, optional
+            Leave out the stress before tstart, which is used when the stress
+            before tmin is replaced by its steady state.
 
         Returns
         -------
@@ -300,13 +474,27 @@ class StressModel(StressModelBase):
 
         """
         self.update_stress(tmin=tmin, tmax=tmax, freq=freq)
-        b = self.rfunc.block(p, dt)
+        b = self.get_block(p, dt)
         stress = self.stress[0].series
-        npoints = stress.index.size
-        h = pd.Series(data=fftconvolve(stress, b, 'full')[:npoints],
+        if tstart is not None:
+            stress = stress.loc[tstart:]
+        h = pd.Series(data=convolve(stress, b),
                       index=stress.index, name=self.name, fastpath=True)
         return h
 
+    def simulate_chunks(self, p, tindex, freq=None, dt=1, chunksize=100000,
+                        tstart=None):
+        self.update_stress(tmin=tindex[0], tmax=tindex[-1], freq=freq)
+        b = self.get_block(p, dt)
+        stress = self.stress[0].series
+        if tstart is not None:
+            stress = stress.loc[tstart:]
+        return self.convolve_chunks(stress, b, tindex, chunksize)
+
+    def steady_state(self, p, index, freq, dt, warmup, istress=None):
+        mean = self.get_warmup_means(index[0], freq, warmup)[0]
+        return self.get_steady_state(self.get_block(p, dt), mean, index)
+
     def dump(self, series=True):
         """Method to export the StressModel object.
 
@@ -408,11 +596,13 @@ class StressModel2(StressModelBase):
         """Set the initial parameters back to their default values.
 
         """
-        self.parameters = self.rfunc.set_parameters(self.name)
-        self.parameters.loc[self.name + '_f'] = (-1.0, -2.0, 2.0, 1, self.name)
+        self.parameters = create_parameters(
+            [(self.name + '_f', -1.0, -2.0, 2.0, 1, self.name)],
+            self.rfunc.set_parameters(self.name))
         self.nparam += 1
 
-    def simulate(self, p, tmin=None, tmax=None, freq=None, dt=1, istress=None):
+    def simulate(self, p, tmin=None, tmax=None, freq=None, dt=1, istress=None,
+                 tstart=None):
         """Simulates the head contribution.
 
         Parameters
@@ -422,6 +612,11 @@ class StressModel2(StressModelBase):
         tmin: str, optional
         tmax: str, optional
         freq: str, optional
+        istress: int, optional
+            Only simulate the contribution of the stress with this index.
+        tstart: pandas.Timestamp, optional
+            Leave out the stresses before tstart, which is used when the
+            stresses before tmin are replaced by their steady state.
 
         Returns
         -------
@@ -430,10 +625,11 @@ class StressModel2(StressModelBase):
 
         """
         self.update_stress(tmin=tmin, tmax=tmax, freq=freq)
-        b = self.rfunc.block(p[:-1], dt)
+        b = self.get_block(p[:-1], dt)
         stress = self.get_stress(p=p, istress=istress)
-        npoints = stress.index.size
-        h = pd.Series(data=fftconvolve(stress, b, 'full')[:npoints],
+        if tstart is not None:
+            stress = stress.loc[tstart:]
+        h = pd.Series(data=convolve(stress, b),
                       index=stress.index, name=self.name, fastpath=True)
         if istress is not None:
             if self.stress[istress].name is not None:
@@ -442,6 +638,26 @@ class StressModel2(StressModelBase):
         # h -= self.rfunc.gain(p) * stress.mean()
         return h
 
+    def simulate_chunks(self, p, tindex, freq=None, dt=1, chunksize=100000,
+                        tstart=None):
+        self.update_stress(tmin=tindex[0], tmax=tindex[-1], freq=freq)
+        b = self.get_block(p[:-1], dt)
+        stress = self.get_stress(p=p)
+        if tstart is not None:
+            stress = stress.loc[tstart:]
+        return self.convolve_chunks(stress, b, tindex, chunksize)
+
+    def steady_state(self, p, index, freq, dt, warmup, istress=None):
+        means = self.get_warmup_means(index[0], freq, warmup)
+        if istress is None:
+            mean = means[0] + p[-1] * means[1]
+        elif istress == 0:
+            mean = means[0]
+        else:
+            mean = p[-1] * means[1]
+        return self.get_steady_state(self.get_block(p[:-1], dt), mean,
+                                     index)
+
     def get_stress(self, p=None, istress=None):
         if istress is None:
             return self.stress[0].series.add(p[-1] * self.stress[1].series)
@@ -502,27 +718,35 @@ class StepModel(StressModelBase):
         self.set_init_parameters()
 
     def set_init_parameters(self):
-        self.parameters = self.rfunc.set_parameters(self.name)
         tmin = pd.Timestamp.min.toordinal()
         tmax = pd.Timestamp.max.toordinal()
         tinit = self.tstart.toordinal()
 
-        self.parameters.loc[self.name + "_tstart"] = (tinit, tmin, tmax,
-                                                      0, self.name)
+        self.parameters = create_parameters(
+            [(self.name + "_tstart", tinit, tmin, tmax, 0, self.name)],
+            self.rfunc.set_parameters(self.name))
         self.nparam += 1
 
-    def simulate(self, p, tmin=None, tmax=None, freq=None, dt=1):
-        tstart = pd.Timestamp.fromordinal(int(p[-1]), freq="D")
+    def simulate(self, p, tmin=None, tmax=None, freq=None, dt=1,
+                 tstart=None):
+        # The step is simulated from tmin, so tstart has no effect
+        tstep = pd.Timestamp.fromordinal(int(p[-1]), freq="D")
         tindex = pd.date_range(tmin, tmax, freq=freq)
         h = pd.Series(0, tindex, name=self.name)
-        h.loc[h.index > tstart] = 1
+        h.loc[h.index > tstep] = 1
 
-        b = self.rfunc.block(p[:-1], dt)
-        npoints = h.index.size
-        h = pd.Series(data=fftconvolve(h, b, 'full')[:npoints],
+        b = self.get_block(p[:-1], dt)
+        h = pd.Series(data=convolve(h, b),
                       index=h.index, name=self.name, fastpath=True)
         return h
 
+    def steady_state(self, p, index, freq, dt, warmup, istress=None):
+        # The step is either fully present or absent before tmin
+        tstep = pd.Timestamp.fromordinal(int(p[-1]), freq="D")
+        mean = 1.0 if tstep < index[0] else 0.0
+        return self.get_steady_state(self.get_block(p[:-1], dt), mean,
+                                     index)
+
     def dump(self, series=True):
         data = {
             "stressmodel": self._name,
@@ -563,12 +787,10 @@ class LinearTrend(StressModelBase):
         tmin = pd.Timestamp.min.toordinal()
         tmax = pd.Timestamp.max.toordinal()
 
-        self.parameters.loc[self.name + "_a"] = (
-            0, -np.inf, np.inf, 1, self.name)
-        self.parameters.loc[self.name + "_tstart"] = (
-            start, tmin, tmax, 1, self.name)
-        self.parameters.loc[self.name + "_tend"] = (
-            end, tmin, tmax, 1, self.name)
+        self.parameters = create_parameters([
+            (self.name + "_a", 0, -np.inf, np.inf, 1, self.name),
+            (self.name + "_tstart", start, tmin, tmax, 1, self.name),
+            (self.name + "_tend", end, tmin, tmax, 1, self.name)])
 
     def simulate(self, p, tmin=None, tmax=None, freq=None, dt=1):
         tindex = pd.date_range(tmin, tmax, freq=freq)
@@ -621,8 +843,9 @@ class Constant(StressModelBase):
         self.set_init_parameters()
 
     def set_init_parameters(self):
-        self.parameters.loc[self.name + "_d"] = (
-            self.value, self.pmin, self.pmax, 1, self.name)
+        self.parameters = create_parameters(
+            [(self.name + "_d", self.value, self.pmin, self.pmax, 1,
+              self.name)])
 
     def simulate(self, p=None):
         return p
@@ -682,22 +905,30 @@ class WellModel(StressModelBase):
         self.parameters = self.rfunc.set_parameters(self.name)
 
     def simulate(self, p=None, tmin=None, tmax=None, freq=None, dt=1,
-                 istress=None):
+                 istress=None, tstart=None):
         self.update_stress(tmin=tmin, tmax=tmax, freq=freq)
-        h = pd.Series(data=0, index=self.stress[0].series.index,
+        h = pd.Series(data=0, index=self.stress[0].series.loc[tstart:].index,
                       name=self.name)
         stresses = self.get_stress(istress=istress)
         radii = self.get_radii(irad=istress)
         for stress, radius in zip(stresses, radii):
-            npoints = stress.index.size
             # TODO Make response function that take the radius as input
             # b = self.rfunc.block(p, dt=dt, radius=radius)
-            b = self.rfunc.block(p, dt)
-            c = fftconvolve(stress, b, 'full')[:npoints]
+            b = self.get_block(p, dt)
+            stress = stress.series.loc[tstart:]
+            c = convolve(stress, b)
             h = h.add(pd.Series(c, index=stress.index), fill_value=0.0)
 
         return h
 
+    def steady_state(self, p, index, freq, dt, warmup, istress=None):
+        means = self.get_warmup_means(index[0], freq, warmup)
+        if istress is None:
+            mean = np.sum(means)
+        else:
+            mean = means[istress]
+        return self.get_steady_state(self.get_block(p, dt), mean, index)
+
     def get_stress(self, p=None, istress=None):
         if istress is None:
             return self.stress
@@ -746,8 +977,8 @@ class FactorModel(StressModelBase):
         self.set_init_parameters()
 
     def set_init_parameters(self):
-        self.parameters.loc[self.name + "_f"] = (
-            self.value, -np.inf, np.inf, 1, self.name)
+        self.parameters = create_parameters(
+            [(self.name + "_f", self.value, -np.inf, np.inf, 1, self.name)])
 
     def simulate(self, p=None, tmin=None, tmax=None, freq=None, dt=1):
         self.update_stress(tmin=tmin, tmax=tmax, freq=freq)
@@ -8,6 +8,7 @@ August 2017, R.A. Collenteur
 
 """
 
+from collections import OrderedDict
 from logging import getLogger
 
 import pandas as pd
@@ -38,6 +39,11 @@ class TimeSeries(object):
     metadata: dict, optional
         Dictionary with metadata of the time series.
     freq_original str, optional
+    validated: bool, optional
+        Trust that the series is already valid (sorted and unique
+        DatetimeIndex without nan-values) and skip the validation and
+        copying of the series. Only use this for series that are created
+        and owned by a trusted loader. Default is False.
     **kwargs: optional
         Any keyword arguments that are provided but are not listed will be
         passed as additional settings.
@@ -50,6 +56,11 @@ class TimeSeries(object):
     To obtain the predefined TimeSeries settings, you can run the following
     line of code: 'ps.TimeSeries._predefined_settings'
 
+    The series that are computed for the last few combinations of settings
+    are cached, so switching back and forth between e.g. two frequencies
+    does not resample the validated series again. The number of cached
+    series is set by 'ps.TimeSeries._cache_size'.
+
     See Also
     --------
     ps.TimeSeries.update_series
@@ -82,13 +93,20 @@ class TimeSeries(object):
                      "fill_before": "mean", "fill_after": "mean",
                      "fill_nan": 0.0},
     }
+    _cache_size = 5
+    _cache_keys = ("freq", "sample_up", "sample_down", "fill_nan",
+                   "fill_before", "fill_after", "tmin", "tmax", "norm",
+                   "time_offset")
 
     def __init__(self, series, name=None, settings=None, metadata=None,
-                 freq_original=None, **kwargs):
+                 freq_original=None, validated=False, **kwargs):
+        self._series_cache = OrderedDict()
+
         if isinstance(series, TimeSeries):
-            # Copy all the series
-            self._series_original = series.series_original.copy()
-            self._series_validated = series.series_validated.copy()
+            # Share the original and validated series, these are never
+            # changed in place, and copy the series
+            self._series_original = series.series_original
+            self._series_validated = series.series_validated
             self._series = series.series.copy()
             # Copy all the properties
             self.freq_original = series.freq_original
@@ -111,8 +129,11 @@ class TimeSeries(object):
 
             validate = True
             update = True
-            # Store a copy of the original series
-            self._series_original = series.copy()
+            # Store a copy of the original series, unless it is trusted
+            if validated:
+                self._series_original = series
+            else:
+                self._series_original = series.copy()
 
             self.freq_original = freq_original
             self.settings = {
@@ -138,7 +159,9 @@ class TimeSeries(object):
         if name is None:
             name = series.name
         self.name = name
-        self._series_original.name = name
+        if self._series_original.name != name:
+            self._series_original = self._series_original.rename(name,
+                                                                 copy=False)
 
         if metadata is not None:
             self.metadata.update(metadata)
@@ -160,7 +183,7 @@ class TimeSeries(object):
 
         # Create a validated series for computations and update
         if validate:
-            self._series_validated = self.validate_series(series)
+            self._series_validated = self.validate_series(series, validated)
         if update:
             self.update_series(force_update=True, **self.settings)
 
@@ -176,10 +199,14 @@ class TimeSeries(object):
         else:
             self._series_original = series
             self._series_validated = self.validate_series(series)
+            self._series_cache.clear()
             self.update_series(force_update=True, **self.settings)
 
     @property
     def series(self):
+        if self._series is None:
+            # The series is left out when the TimeSeries is pickled
+            self.update_series(force_update=True)
         return self._series
 
     @series.setter
@@ -199,6 +226,38 @@ class TimeSeries(object):
             'calculated from series_original. Please set '
             'series_original to update the series.'))
 
+    def __getstate__(self):
+        """Method to get the state of the TimeSeries for pickling, e.g. to
+        send it to another process.
+
+        Notes
+        -----
+        The cached series and the series computed from the settings are left
+        out, and the original series only when it equals the validated
+        series. The series is computed again when it is needed.
+
+        """
+        state = self.__dict__.copy()
+        state["_series_cache"] = OrderedDict()
+        state["_series"] = None
+        original = self._series_original
+        validated = self._series_validated
+        if original is validated or (original.name == validated.name and
+                                     original.dtype == validated.dtype and
+                                     original.equals(validated)):
+            # Only the name of the index can differ
+            state["_series_original"] = original.index.name
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if not isinstance(self._series_original, pd.Series):
+            name = self._series_original
+            self._series_original = self._series_validated
+            if name != self._series_validated.index.name:
+                self._series_original = self._series_validated.rename_axis(
+                    name, copy=False)
+
     def __repr__(self):
         """Prints a simple string representation of the time series.
         """
@@ -210,13 +269,17 @@ class TimeSeries(object):
                                tmin=self.settings["tmin"],
                                tmax=self.settings["tmax"])
 
-    def validate_series(self, series):
+    def validate_series(self, series, validated=False):
         """ This method performs some PASTAS specific tests for the TimeSeries.
 
         Parameters
         ----------
         series: pd.Series
             Pandas series object containing the series time series.
+        validated: bool, optional
+            Trust that the series is already valid and skip all the checks
+            and copies, except for determining the frequency. Default is
+            False.
 
         Returns
         -------
@@ -234,47 +297,65 @@ class TimeSeries(object):
             making the index a pandas DateTimeIndex.
             5. Duplicate indices are removed (by averaging).
 
-        """
-
-        # 2. Make sure the indices are Timestamps and sorted
-        series.index = pd.to_datetime(series.index)
-        series.sort_index(inplace=True)
-        series.index.name = "Date"
-        series = series.astype(float)
+        A series that already has a sorted and unique DatetimeIndex,
+        float values and no nan-values is only copied, skipping the other
+        steps.
 
-        # 3. Drop nan-values at the beginning and end of the time series
-        series = series.loc[series.first_valid_index():series.last_valid_index(
-        )].copy(deep=True)
+        """
+        valid = validated or self._is_valid(series)
+
+        if valid:
+            # 1. Series is already valid, only copy it when not trusted
+            if not validated:
+                series = series.copy(deep=True)
+            series = series.astype(float, copy=False)
+            series = series.rename_axis("Date", copy=False)
+        else:
+            # 2. Make sure the indices are Timestamps and sorted
+            if not isinstance(series.index, pd.DatetimeIndex):
+                series.index = pd.to_datetime(series.index)
+            series.sort_index(inplace=True)
+            series.index.name = "Date"
+            series = series.astype(float)
+
+            # 3. Drop nan-values at the beginning and end of the time series
+            series = series.loc[
+                     series.first_valid_index():series.last_valid_index(
+                     )].copy(deep=True)
 
         # 4. Find the frequency of the original series
         if self.freq_original:
             pass
-        elif pd.infer_freq(series.index):
-            self.freq_original = pd.infer_freq(series.index)
-            logger.info("Inferred frequency from time series %s: freq=%s " % (
-                self.name, self.freq_original))
         else:
-            self.freq_original = self.settings["freq"]
-            if self.freq_original is None:
-                logger.info(
-                    "Cannot determine frequency of series %s" % self.name)
-            elif self.settings["fill_nan"] and self.settings["fill_nan"] != \
-                    "drop":
-                logger.warning("User-provided frequency is applied when "
-                               "validating the Time Series %s. Make sure the "
-                               "provided frequency is close to the real "
-                               "frequency of the original series." % self.name)
-
-        # 5. Handle duplicate indices
-        if not series.index.is_unique:
-            logger.warning("duplicate time-indexes were found in the Time "
-                           "Series %s. Values were averaged." % self.name)
-            grouped = series.groupby(level=0)
-            series = grouped.mean()
-
-        # 6. drop nan-values
-        if series.hasnans:
-            series = self.fill_nan(series)
+            freq = pd.infer_freq(series.index)
+            if freq:
+                self.freq_original = freq
+                logger.info("Inferred frequency from time series %s: "
+                            "freq=%s " % (self.name, self.freq_original))
+            else:
+                self.freq_original = self.settings["freq"]
+                if self.freq_original is None:
+                    logger.info(
+                        "Cannot determine frequency of series %s" % self.name)
+                elif self.settings["fill_nan"] and \
+                        self.settings["fill_nan"] != "drop":
+                    logger.warning("User-provided frequency is applied when "
+                                   "validating the Time Series %s. Make sure "
+                                   "the provided frequency is close to the "
+                                   "real frequency of the original series."
+                                   % self.name)
+
+        if not valid:
+            # 5. Handle duplicate indices
+            if not series.index.is_unique:
+                logger.warning("duplicate time-indexes were found in the Time "
+                               "Series %s. Values were averaged." % self.name)
+                grouped = series.groupby(level=0)
+                series = grouped.mean()
+
+            # 6. drop nan-values
+            if series.hasnans:
+                series = self.fill_nan(series)
 
         if self.settings["tmin"] is None:
             self.settings["tmin"] = series.index.min()
@@ -283,6 +364,20 @@ class TimeSeries(object):
 
         return series
 
+    @staticmethod
+    def _is_valid(series):
+        """Internal method to check if a series is already valid, meaning it
+        has a sorted and unique DatetimeIndex, float values and no
+        nan-values. The cheapest checks are done first.
+
+        """
+        index = series.index
+        return (isinstance(index, pd.DatetimeIndex) and
+                series.dtype == float and
+                index.is_monotonic_increasing and
+                index.is_unique and
+                not series.hasnans)
+
     def update_settings(self, **kwargs):
         """Internal method that check if an update is actually necessary.
 
@@ -346,10 +441,17 @@ class TimeSeries(object):
         Notes
         -----
         The method will validate if any of the settings is changed to
-        determine if the series need to be updated.
+        determine if the series need to be updated. Series computed before
+        for the same settings are taken from the cache when available.
 
         """
         if self.update_settings(**kwargs) or force_update:
+            key = self._get_cache_key()
+            if key in self._series_cache and not force_update:
+                self._series_cache.move_to_end(key)
+                self._series = self._series_cache[key]
+                return
+
             # Get the validated series to start with
             series = self.series_validated.copy(deep=True)
 
@@ -360,6 +462,32 @@ class TimeSeries(object):
             series = self.normalize(series)
 
             self._series = series
+            self._add_to_cache(key, series)
+
+    def _get_cache_key(self):
+        """Internal method to get the key for the series cache from the
+        settings that determine the series.
+
+        """
+        return tuple(self.settings[key] for key in self._cache_keys)
+
+    def _add_to_cache(self, key, series):
+        """Internal method to store a series in the cache and remove the
+        least recently used series when the cache is full.
+
+        """
+        if self._cache_size < 1:
+            return
+        self._series_cache[key] = series
+        self._series_cache.move_to_end(key)
+        while len(self._series_cache) > self._cache_size:
+            self._series_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Method to remove all series from the cache of computed series.
+
+        """
+        self._series_cache.clear()
 
     def change_frequency(self, series):
         """Method to change the frequency of the time series.
@@ -625,8 +753,34 @@ class TimeSeries(object):
     def multiply(self, other):
         self._series = self.series.multiply(other)
         self._series_original = self.series_original.multiply(other)
+        self._series_cache.clear()
         self.update_series(force_update=True)
 
+    def clone(self):
+        """Method to get a new TimeSeries with its own settings and
+        metadata, that shares all series with this TimeSeries.
+
+        Returns
+        -------
+        ts: pastas.TimeSeries
+            The new TimeSeries.
+
+        Notes
+        -----
+        The series of a TimeSeries are never changed in place, but replaced
+        by a new series when the settings change. Changing the settings of
+        either TimeSeries therefore does not change the other, while the
+        series are only copied when they are updated.
+
+        """
+        # Do not use copy, which leaves out the series (see __getstate__)
+        ts = self.__class__.__new__(self.__class__)
+        ts.__dict__.update(self.__dict__)
+        ts.settings = self.settings.copy()
+        ts.metadata = self.metadata.copy()
+        ts._series_cache = self._series_cache.copy()
+        return ts
+
     def dump(self, series=True):
         """Method to export the Time Series to a json format.
 
@@ -648,6 +802,7 @@ class TimeSeries(object):
 
         if series is True or series == "original":
             data["series"] = self.series_original
+            data["validated"] = self._is_valid(self.series_original)
         elif series == "modified":
             data["series"] = self
 
@@ -4,9 +4,9 @@
 
 """
 import numpy as np
-from pandas import DataFrame
 
 from .model import Model
+from .parameters import create_parameters
 
 
 class ThresholdTransform:
@@ -58,12 +58,11 @@ class ThresholdTransform:
         self.set_init_parameters()
 
     def set_init_parameters(self):
-        self.parameters = DataFrame(
-            columns=['initial', 'pmin', 'pmax', 'vary', 'name'])
-        self.parameters.loc[self.name + '_1'] = (
-            self.value, self.vmin, self.vmax, 1, self.name)
+        rows = [(self.name + '_1', self.value, self.vmin, self.vmax, 1,
+                 self.name)]
         if self.nparam == 2:
-            self.parameters.loc[self.name + '_2'] = (0.5, 0., 1., 1, self.name)
+            rows.append((self.name + '_2', 0.5, 0., 1., 1, self.name))
+        self.parameters = create_parameters(rows)
 
     def simulate(self, h, p):
         if self.nparam == 1:
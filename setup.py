@@ -36,6 +36,7 @@ setup(
     platforms='Windows, Mac OS-X',
     install_requires=['numpy>=1.10', 'matplotlib>=1.5', 'pandas>=0.22',
                       'scipy>=1.0'],
+    extras_require={'zstd': ['zstandard']},
     packages=find_packages(exclude=[]),
     package_data={"pastas": ["log_config.json"], },
 )
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import pastas as ps
+
+
+def _create_model(tsteady=None):
+    rng = np.random.RandomState(0)
+    index = pd.date_range("1990-01-01", "2009-12-31", freq="D")
+    prec = pd.Series(rng.gamma(0.4, 5, index.size) / 1000, index=index,
+                     name="prec")
+    evap = pd.Series(0.002, index=index, name="evap")
+    if tsteady is not None:
+        prec.loc[:tsteady] = prec.loc[:tsteady].mean()
+    obs = pd.Series(rng.normal(10, 0.1, index.size), index=index,
+                    name="obs").iloc[::14]
+    ml = ps.Model(obs, log_level="ERROR")
+    sm = ps.StressModel2([prec, evap], ps.Exponential, name="recharge")
+    ml.add_stressmodel(sm)
+    return ml
+
+
+@pytest.fixture
+def create_model():
+    """Fixture with a function that creates a model with a recharge
+    stressmodel and synthetic series, for the tests that need a model.
+
+    """
+    return _create_model
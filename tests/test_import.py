@@ -0,0 +1,15 @@
+import os
+import subprocess
+import sys
+
+import pastas as ps
+
+
+def test_lazy_imports():
+    # Plotting, scipy.io, lmfit and geopandas are imported on first use
+    code = ("import sys, pastas; "
+            "print([m for m in ('matplotlib', 'scipy.io', 'lmfit', "
+            "'geopandas') if m in sys.modules])")
+    cwd = os.path.dirname(os.path.dirname(ps.__file__))
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=cwd)
+    assert out.decode().strip() == "[]"
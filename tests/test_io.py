@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+import pastas as ps
+from pastas.io import npz
+
+
+def test_dump_load_npz(tmpdir, create_model):
+    ml = create_model()
+    ml.set_initial("recharge_a", 100.0)
+    fname = str(tmpdir.join("model.npz"))
+    ml.dump(fname)
+    ml2 = ps.io.load(fname)
+    assert ml2.settings == ml.settings
+    assert np.allclose(ml2.parameters.initial, ml.parameters.initial)
+    assert ml2.oseries.series_original.equals(ml.oseries.series_original)
+    assert np.allclose(ml2.simulate(), ml.simulate())
+
+
+@pytest.mark.parametrize("ext", [".pas.gz", ".pas.xz", ".pas.zst"])
+def test_dump_load_compressed(tmpdir, ext, create_model):
+    if ext == ".pas.zst":
+        pytest.importorskip("zstandard")
+    ml = create_model()
+    ml.dump(str(tmpdir.join("model.pas")))
+    fname = str(tmpdir.join("model" + ext))
+    ml.dump(fname)
+    ml2 = ps.io.load(fname)
+    assert tmpdir.join("model" + ext).size() < \
+        tmpdir.join("model.pas").size() / 2
+    assert np.allclose(ml2.parameters.initial, ml.parameters.initial)
+    assert np.allclose(ml2.simulate(), ml.simulate(), atol=1e-5)
+
+
+def test_dump_compressed_npz(tmpdir, create_model):
+    ml = create_model()
+    with pytest.raises(ValueError):
+        ml.dump(str(tmpdir.join("model.npz.gz")))
+
+
+def test_npz_stores_series_once(tmpdir, create_model):
+    ml = create_model()
+    data = ml.dump_data()
+    data["stressmodels"]["copy"] = data["stressmodels"]["recharge"]
+    fname = str(tmpdir.join("model.npz"))
+    npz.dump(fname, data)
+    with np.load(fname) as f:
+        assert f["offsets"].size == 4  # oseries, prec and evap
+    data = npz.load(fname)
+    stress = data["stressmodels"]["recharge"]["stress"][0]["series"]
+    assert stress is data["stressmodels"]["copy"]["stress"][0]["series"]
+
+
+@pytest.fixture
+def project(create_model):
+    ml = create_model()
+    mls = ps.Project(name="project")
+    mls.add_series(ml.oseries.series_original, name="obs", kind="oseries")
+    for stress in ml.stressmodels["recharge"].stress:
+        mls.add_series(stress.series_original, name=stress.name,
+                       kind=stress.name)
+    for name in ["model1", "model2"]:
+        ml = mls.add_model("obs", model_name=name, log_level="ERROR")
+        sm = ps.StressModel2([mls.stresses.loc["prec", "series"],
+                              mls.stresses.loc["evap", "series"]],
+                             ps.Exponential, name="recharge")
+        ml.add_stressmodel(sm)
+    return mls
+
+
+@pytest.mark.parametrize("ext", [".pas", ".npz"])
+def test_project_stores_series_once(tmpdir, ext, project):
+    mls = project
+    data = mls.dump_data(series=True)
+    assert len(data["series_table"]) == 3  # obs, prec and evap
+    fname = str(tmpdir.join("project" + ext))
+    mls.dump(fname, series=True)
+    mls2 = ps.io.load(fname)
+    prec = mls2.stresses.loc["prec", "series"].series_original
+    for ml in mls2.models.values():
+        assert ml.stressmodels["recharge"].stress[0].series_original is prec
+        # The .pas format stores the series with 10 significant digits
+        assert np.allclose(ml.simulate(), mls.models[ml.name].simulate(),
+                           atol=1e-5)
+
+
+def test_load_project_lazy(tmpdir, project):
+    mls = project
+    fname = str(tmpdir.join("project.pas"))
+    mls.dump(fname)
+    mls2 = ps.io.load(fname, lazy=True, max_models=1)
+    assert list(mls2.models) == ["model1", "model2"]
+    mls2.get_parameters(["recharge_A"])
+    assert not any(mls2.models.is_loaded(name) for name in mls2.models)
+    mls2.models["model1"].set_initial("recharge_a", 100.0)
+    mls2.models["model2"]
+    assert not mls2.models.is_loaded("model1")
+    ml = mls2.models["model1"]
+    assert ml.parameters.loc["recharge_a", "initial"] == 100.0
+
+
+def test_lazy_models_dump_data(tmpdir, project):
+    mls = project
+    fname = str(tmpdir.join("project.pas"))
+    mls.dump(fname, series=True)
+    mls2 = ps.io.load(fname, lazy=True, max_models=1)
+    mls2.models["model1"]
+    for kwargs in [dict(series=False, file_info=False), dict(series=True)]:
+        data1 = mls2.models.dump_data("model1", **kwargs)
+        data2 = mls2.models.dump_data("model2", **kwargs)
+        assert not mls2.models.is_loaded("model2")
+        assert sorted(data1) == sorted(data2)
+        assert sorted(data1["oseries"]) == sorted(data2["oseries"])
+        stress1 = data1["stressmodels"]["recharge"]["stress"][0]
+        stress2 = data2["stressmodels"]["recharge"]["stress"][0]
+        assert sorted(stress1) == sorted(stress2)
+
+
+def test_lazy_models_failed_load(create_model):
+    data = create_model().dump_data(series=True)
+    data["noisemodel"] = {"type": "Unknown"}
+    models = ps.project.lazy.LazyModels({"model": data})
+    for _ in range(2):
+        with pytest.raises(AttributeError):
+            models["model"]
+    assert "stressmodel" in data["stressmodels"]["recharge"]
+    assert isinstance(data["stressmodels"]["recharge"]["stress"][0], dict)
+
+
+def test_load_project_parallel(tmpdir, project):
+    mls = project
+    mls.models["model2"].set_initial("recharge_a", 100.0)
+    fname = str(tmpdir.join("project.npz"))
+    mls.dump(fname)
+    mls2 = ps.io.load(fname, n_jobs=2)
+    prec = mls2.stresses.loc["prec", "series"].series_original
+    for ml in mls2.models.values():
+        assert ml.stressmodels["recharge"].stress[0].series_original is prec
+        assert np.allclose(ml.simulate(), mls.models[ml.name].simulate())
+    sm = mls2.models["model2"].stressmodels["recharge"]
+    assert sm.parameters.loc["recharge_a", "initial"] == 100.0
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_load_project_invalid_model(tmpdir, monkeypatch, n_jobs, project):
+    errors = []
+    monkeypatch.setattr(ps.io.base.logger, "error",
+                        lambda msg, *args, **kwargs: errors.append(msg % args))
+    mls = project
+    fname = str(tmpdir.join("project.npz"))
+    mls.dump(fname)
+    data = npz.load(fname)
+    data["models"]["model2"]["stressmodels"]["recharge"]["rfunc"] = "Unknown"
+    mls2 = ps.io.base.load_project(data, n_jobs=n_jobs)
+    assert list(mls2.models) == ["model1"]
+    assert len(errors) == 1 and "model2" in errors[0]
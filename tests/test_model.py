@@ -0,0 +1,178 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import pastas as ps
+
+
+def test_steady_state_warmup(create_model):
+    ml = create_model(tsteady="1999-12-31")
+    ml.set_initial("recharge_a", 100.0)
+    tmin, tmax = "2000-01-01", "2009-12-31"
+    sim = ml.simulate(tmin=tmin, tmax=tmax)
+    ml.settings["warmup_mode"] = "steady"
+    sim_steady = ml.simulate(tmin=tmin, tmax=tmax)
+    assert np.allclose(sim, sim_steady)
+    contrib = ml.get_contribution("recharge", tmin=tmin, tmax=tmax)
+    assert np.allclose(contrib + ml.get_parameters("constant"), sim_steady)
+
+
+def test_steady_state_warmup_stressmodel():
+    # The stress before tmin is not cut, as there is no fill_before
+    index = pd.date_range("1960-01-01", "2009-12-31", freq="D")
+    stress = pd.Series(0.001, index=index, name="stress")
+    obs = pd.Series(10.0, index=index[index.year >= 2000][::14], name="obs")
+    ml = ps.Model(obs, log_level="ERROR")
+    ml.add_stressmodel(ps.StressModel(stress, ps.Gamma, name="stress"))
+    ml.set_initial("stress_a", 500.0)
+    tmin, tmax = "2000-01-01", "2009-12-31"
+    sim = ml.simulate(tmin=tmin, tmax=tmax)
+    ml.settings["warmup_mode"] = "steady"
+    sim_steady = ml.simulate(tmin=tmin, tmax=tmax)
+    assert ml.sim_index[0] == pd.Timestamp(tmin)
+    assert np.allclose(sim, sim_steady)
+    contrib = ml.get_contribution("stress", tmin=tmin, tmax=tmax)
+    assert np.allclose(contrib + ml.get_parameters("constant"), sim_steady)
+    contribs = ml.get_contributions(tmin=tmin, tmax=tmax)
+    assert np.allclose(contribs["Simulation"], sim_steady)
+    # The stress before tmin is not convolved in steady mode
+    contrib = ml.get_contribution("stress", tmin=tmin, tmax=tmax,
+                                  return_warmup=True)
+    assert contrib.index[0] == pd.Timestamp(tmin)
+
+
+def test_sim_index_arguments(create_model):
+    ml = create_model()
+    sim = ml.simulate()
+    ml.get_contribution("recharge", tmin="2005-01-01")
+    assert ml.simulate().index.equals(sim.index)
+
+
+def test_solve_steady_state(create_model):
+    ml = create_model()
+    ml.solve(warmup_mode="steady", report=False)
+    assert ml.simulate().index[0] == ml.settings["tmin"]
+
+
+def test_simulate_chunks(create_model):
+    ml = create_model()
+    sim = ml.simulate()
+    sim_chunks = pd.concat(ml.simulate_chunks(chunksize=1000))
+    assert np.allclose(sim, sim_chunks)
+    assert sim.index.equals(sim_chunks.index)
+
+
+def test_simulate_memmap(tmpdir, create_model):
+    ml = create_model()
+    sim = ml.simulate()
+    sim_memmap = ml.simulate_memmap(str(tmpdir.join("sim.dat")),
+                                    chunksize=1000)
+    assert np.allclose(sim, sim_memmap.loc[sim.index])
+
+
+def test_get_contributions(create_model):
+    ml = create_model()
+    ml.add_transform(ps.ThresholdTransform())
+    ml.set_initial("recharge_a", 100.0)
+    tmin, tmax = "2000-01-01", "2009-12-31"
+    contribs = ml.get_contributions(tmin=tmin, tmax=tmax)
+    sim = ml.simulate(tmin=tmin, tmax=tmax)
+    assert contribs.index.equals(sim.index)
+    assert np.allclose(contribs["Simulation"], sim)
+    contrib = ml.get_contribution("recharge", tmin=tmin, tmax=tmax)
+    assert np.allclose(contribs["recharge"], contrib.loc[sim.index])
+    contrib = ml.get_contribution("recharge", tmin=tmin, tmax=tmax,
+                                 istress=1)
+    assert np.allclose(contribs["recharge (evap)"], contrib.loc[sim.index])
+    total = contribs[["recharge", "constant", "transform"]].sum(axis=1)
+    assert np.allclose(total, sim)
+
+
+def test_get_transform_contribution(create_model):
+    ml = create_model()
+    ml.set_initial("recharge_a", 100.0)
+    tmin, tmax = "2000-01-01", "2009-12-31"
+    sim_org = ml.simulate(tmin=tmin, tmax=tmax)
+    ml.add_transform(ps.ThresholdTransform())
+    sim = ml.simulate(tmin=tmin, tmax=tmax)
+    contrib = ml.get_transform_contribution(tmin=tmin, tmax=tmax)
+    assert (contrib < 0.0).any()
+    assert np.allclose(contrib, sim - sim_org)
+    contribs = ml.get_contributions(tmin=tmin, tmax=tmax)
+    assert np.allclose(contrib, contribs["transform"])
+
+
+def test_get_init_parameters(create_model):
+    ml = create_model()
+    parameters = ml.get_init_parameters()
+    assert list(parameters.index) == ["recharge_A", "recharge_a",
+                                      "recharge_f", "constant_d",
+                                      "noise_alpha"]
+    assert list(parameters.name) == ["recharge"] * 3 + ["constant", "noise"]
+    for col in ["initial", "pmin", "pmax", "optimal", "stderr"]:
+        assert parameters[col].dtype == float
+    assert parameters.optimal.isnull().all()
+    sm = ml.stressmodels["recharge"]
+    assert np.allclose(parameters.initial.values[:3],
+                       sm.parameters.initial.values)
+
+
+def test_get_parameters_name(create_model):
+    ml = create_model()
+    ml.add_transform(ps.ThresholdTransform())
+    for name in ["recharge", "constant", "ThresholdTransform", "noise"]:
+        p = ml.parameters.initial[ml.parameters.name == name].values
+        assert np.array_equal(ml.get_parameters(name), p)
+    ml.del_stressmodel("recharge")
+    assert np.array_equal(ml.get_parameters("noise"),
+                          ml.parameters.initial.values[-1:])
+
+
+def test_add_component_name_in_use(create_model):
+    ml = create_model()
+    ml.add_transform(ps.ThresholdTransform())
+    stress = ml.stressmodels["recharge"].stress[0].series_original
+    for name in ["constant", "noise", "ThresholdTransform"]:
+        ml.add_stressmodel(ps.StressModel(stress, ps.Gamma, name=name))
+        assert name not in ml.stressmodels
+    ml.add_constant(ps.Constant(name="recharge"))
+    assert ml.constant.name == "constant"
+    assert np.array_equal(ml.get_parameters("recharge"),
+                          ml.parameters.initial.values[:3])
+
+
+def test_clone(create_model):
+    ml = create_model()
+    ml.set_initial("recharge_a", 100.0)
+    sim = ml.simulate()
+    ml2 = ml.clone(name="clone")
+    assert ml2.name == "clone"
+
+    # The series are shared, the settings and parameters are not
+    stress, stress2 = ml.stressmodels["recharge"].stress[0], \
+        ml2.stressmodels["recharge"].stress[0]
+    assert stress2 is not stress
+    assert stress2.series_original is stress.series_original
+    assert stress2.series is stress.series
+    assert np.allclose(ml2.simulate(), sim)
+    ml2.set_initial("recharge_a", 50.0)
+    assert ml.parameters.loc["recharge_a", "initial"] == 100.0
+    ml2.settings["freq"] = "7D"
+    ml2.simulate()
+    assert ml.settings["freq"] == "D"
+    assert stress.settings["freq"] == "D"
+    assert stress2.series is not stress.series
+    assert np.allclose(ml.simulate(), sim)
+    assert ml2.stats.ml is ml2 and ml2.plots.ml is ml2
+
+
+def test_pickle(create_model):
+    ml = create_model()
+    ml.solve(report=False)
+    ml2 = pickle.loads(pickle.dumps(ml))
+    assert np.allclose(ml2.simulate(), ml.simulate())
+    assert np.allclose(ml2.residuals(), ml.residuals())
+    assert ml2.stats.ml is ml2 and ml2.plots.ml is ml2
+    assert ml2.odelt.equals(ml.odelt)
+    assert ml2.fit_report() == ml.fit_report()
@@ -0,0 +1,45 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+import pastas as ps
+from pastas.plots import minmax_downsample
+
+
+def test_minmax_downsample():
+    index = pd.date_range("2000-01-01", periods=10000, freq="H")
+    series = pd.Series(np.sin(np.arange(index.size) / 100.0), index=index)
+    series.iloc[5000:5600] = np.nan
+    sample = minmax_downsample(series, 100)
+    assert sample.size <= 202
+    assert sample.index.is_monotonic_increasing
+    assert sample.index[0] == index[0] and sample.index[-1] == index[-1]
+    assert sample.min() == series.min() and sample.max() == series.max()
+    assert sample.isnull().any()
+    assert minmax_downsample(series, 5000) is series
+
+
+def test_plots_downsample(create_model):
+    ml = create_model()
+    axes = ml.plots.decomposition()
+    npoints = axes[1].get_lines()[0].get_xdata().size
+    assert npoints < ml.get_contribution("recharge").size
+    ml.plots.downsample = False
+    axes = ml.plots.decomposition()
+    assert axes[1].get_lines()[0].get_xdata().size > npoints
+
+
+def test_plots_observations_not_downsampled():
+    index = pd.date_range("1990-01-01", "2009-12-31", freq="D")
+    obs = pd.Series(np.random.normal(10, 0.1, index.size), index=index,
+                    name="obs")
+    ml = ps.Model(obs, log_level="ERROR")
+    ml.add_stressmodel(ps.StressModel(obs - 10, ps.Exponential,
+                                      name="stress"))
+    axes = ml.plots.results()
+    assert axes[0].get_lines()[0].get_xdata().size == \
+        ml.observations().size
+    assert axes[0].get_lines()[1].get_xdata().size < ml.simulate().size
@@ -0,0 +1,166 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pastas as ps
+from pastas.read.dinoloket import DinoGrondwaterstand
+from pastas.read.knmi import KnmiStation
+from pastas.read.menyanthes import MenyData
+from pastas.utils import datetime2matlab
+
+dino_fname = os.path.join(os.path.dirname(__file__), "data",
+                          "dino_gwl_data.csv")
+knmi_fname = os.path.join(os.path.dirname(__file__), "data",
+                          "knmi_rain_data.txt")
+
+
+def test_read_dino():
+    dino = DinoGrondwaterstand(dino_fname)
+    assert dino.locatie == "B58C0698"
+    assert dino.filternummer == 1
+    assert dino.maaiveld == 30.17
+    assert dino.data.index[0] == pd.Timestamp("1985-11-14")
+    assert dino.data["Stand_cm_tov_NAP"].dtype == np.float64
+    assert dino.data["Filternummer"].dtype == np.int64
+
+    ts = ps.read_dino(dino_fname)
+    assert ts.name == "B58C0698_1"
+    assert ts.series.iloc[0] == 27.61
+
+
+def test_read_dino_irregular(tmpdir):
+    with open(dino_fname) as f:
+        text = f.read()
+    text = text.replace("B58C0698,001,14-11-1985,", "B58C0698,001,14-11-1985"
+                        "\u00a0,")
+    text = text.replace("B58C0698,001,28-11-1985,", "B58C0698,,28-11-1985,")
+    fname = tmpdir.join("dino.csv")
+    fname.write_text(text, encoding="utf-8")
+    dino = DinoGrondwaterstand(str(fname))
+    assert dino.data.index[0] == pd.Timestamp("1985-11-14")
+    assert np.isnan(dino.data["Filternummer"].iloc[1])
+    assert dino.data["Filternummer"].iloc[2] == 1
+
+
+def test_read_dino_without_metadata(tmpdir):
+    with open(dino_fname) as f:
+        lines = f.readlines()
+    # Leave out the block with the metadata
+    fname = tmpdir.join("dino.csv")
+    fname.write("".join(lines[:11] + lines[15:]))
+    dino = DinoGrondwaterstand(str(fname))
+    assert dino.meta == []
+    assert dino.locatie == ""
+    assert np.isnan(dino.filternummer)
+    assert dino.data.index[0] == pd.Timestamp("1985-11-14")
+
+    ts = ps.read_dino(str(fname))
+    assert ts.series.iloc[0] == 27.61
+
+
+def test_read_dino_dir(tmpdir):
+    for name in ["a.csv", "b.csv"]:
+        shutil.copy(dino_fname, str(tmpdir.join(name)))
+    tmpdir.join("c.csv").write("not a dino file")
+    oseries = ps.read_dino_dir(str(tmpdir))
+    assert sorted(oseries) == ["a", "b"]
+    assert oseries["a"].series.equals(ps.read_dino(dino_fname).series)
+
+
+def test_read_knmi():
+    knmi = KnmiStation.fromfile(knmi_fname)
+    assert list(knmi.data.columns) == ["STN", "RD", "SX"]
+    # The rainfall is measured from 08:00 UT the day before
+    assert knmi.data.index[0] == pd.Timestamp("1951-01-01 09:00")
+    assert np.isclose(knmi.data["RD"].iloc[0], 0.0013)
+
+    rd = KnmiStation.fromfile(knmi_fname, variables=["RD"])
+    assert list(rd.data.columns) == ["STN", "RD"]
+    assert rd.data["RD"].equals(knmi.data["RD"])
+    sx = KnmiStation.fromfile(knmi_fname, variables=["SX"])
+    assert sx.data.index.equals(knmi.data.index)
+
+    ts = ps.read_knmi(knmi_fname, variables="RD")
+    assert ts.settings["fill_nan"] == 0.0
+
+    with pytest.raises(ValueError, match=r"\['STN', 'RD', 'SX'\]"):
+        ps.read_knmi(knmi_fname, variables="EV24")
+
+
+def test_read_meny(tmpdir):
+    from scipy.io import savemat
+    index = pd.date_range("2000-01-01", periods=100, freq="D")
+    values = np.column_stack([datetime2matlab(index), np.arange(100.0)])
+    H = np.empty(3, dtype=object)
+    for i in range(3):
+        H[i] = {"Name": "H%s" % i, "values": values, "xcoord": 1.0,
+                "ycoord": 2.0, "upfiltlev": 0.0, "lowfiltlev": -1.0}
+    fname = str(tmpdir.join("test.men"))
+    savemat(fname, {"H": H, "IN": np.empty(0, dtype=object)})
+
+    meny = MenyData(fname, data="H", locations=["H0", "H2"])
+    assert list(meny.H) == ["H0", "H2"]
+    assert not hasattr(meny, "IN")
+    assert meny.H["H2"]["values"].index.equals(index)
+
+    ts = ps.read_meny(fname, locations=["H1"])
+    assert ts.name == "H1"
+    assert ts.series.iloc[-1] == 99.0
+
+
+def test_read_waterbase(tmpdir):
+    lines = ["MEETPUNT_IDENTIFICATIE;WAARNEMINGDATUM;WAARNEMINGTIJD;"
+             "NUMERIEKEWAARDE;WAARDEBEPALINGSMETHODE_OMSCHRIJVING;EPSG;X;Y"]
+    for i in range(10):
+        for name in ["A", "B"]:
+            lines.append("%s;%02d-03-2018;1%s:00:00;%s;ge\xefnterpoleerd;"
+                         "25831;1,5;2" % (name, i + 1, i, i))
+    lines[-1] = lines[-1].replace(";1,5;", ";-999999999;")
+    fname = tmpdir.join("waterbase.csv")
+    fname.write_binary("\r".join(lines).encode("ISO-8859-1"))
+
+    ts = ps.read_waterbase(str(fname), chunksize=3)
+    assert [t.name for t in ts] == ["A", "B"]
+    series = ts[1].series_original
+    assert series.index[-1] == pd.Timestamp("2018-03-10 19:00")
+    assert series.values.tolist() == list(range(10))
+    assert ts[1].metadata["x"] == 1.5
+    assert ts[1].metadata["projection"] == "epsg:25831"
+
+    a = ps.read_waterbase(str(fname), locations="A")
+    assert a.series_original.equals(ts[0].series_original)
+
+
+def test_read_cache(tmpdir):
+    cache = tmpdir.join("cache")
+    fname = str(tmpdir.join("dino.csv"))
+    shutil.copy(dino_fname, fname)
+    ps.read.set_cache(str(cache))
+    try:
+        ts = ps.read_dino(fname)
+        assert len(cache.listdir()) == 1
+        ts2 = ps.read_dino(fname)
+        assert ts2 is not ts
+        assert ts2.series_original.equals(ts.series_original)
+        assert ts2.metadata == ts.metadata
+
+        # Other arguments or a changed file give a new entry
+        ps.read_dino(fname, factor=1.0)
+        with open(fname, "a") as f:
+            f.write("B58C0698,001,14-07-2015,268,260,2757,,,,,,\n")
+        assert len(ps.read_dino(fname).series_original) == \
+            len(ts.series_original) + 1
+        assert len(cache.listdir()) == 3
+
+        ps.read.clear_cache(fname)
+        assert len(cache.listdir()) == 0
+
+        # The least recently used entries are removed from a full cache
+        ps.read.set_cache(str(cache), max_size=1)
+        ps.read_dino(fname)
+        assert len(cache.listdir()) == 0
+    finally:
+        ps.read.set_cache(None)
@@ -0,0 +1,56 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import pastas as ps
+
+
+def create_series():
+    index = pd.date_range("2000-01-01", "2001-12-31", freq="D")
+    return pd.Series(np.arange(index.size, dtype=float), index=index,
+                     name="prec")
+
+
+def test_update_series_cache():
+    ts = ps.TimeSeries(create_series(), settings="prec", freq="D")
+    series_daily = ts.series
+    ts.update_series(freq="7D")
+    series_weekly = ts.series
+    ts.update_series(freq="D")
+    assert ts.series is series_daily
+    ts.update_series(freq="7D")
+    assert ts.series is series_weekly
+
+
+def test_update_series_cache_size():
+    ts = ps.TimeSeries(create_series(), settings="prec")
+    for freq in ["2D", "3D", "4D", "5D", "6D", "7D"]:
+        ts.update_series(freq=freq)
+    assert len(ts._series_cache) == ts._cache_size
+    ts.clear_cache()
+    assert len(ts._series_cache) == 0
+
+
+def test_validate_series_valid():
+    series = create_series()
+    ts = ps.TimeSeries(series)
+    assert ts.series_validated.equals(series)
+    assert not np.shares_memory(ts.series_validated.values, series.values)
+    assert ts.freq_original == "D"
+
+
+def test_validate_series_trusted():
+    series = create_series()
+    ts = ps.TimeSeries(series, validated=True)
+    assert ts.series_original is series
+    assert ts.series_validated.equals(series)
+
+
+def test_pickle():
+    ts = ps.TimeSeries(create_series(), settings="prec", freq="7D")
+    ts2 = pickle.loads(pickle.dumps(ts))
+    assert ts2._series is None
+    assert ts2.series.equals(ts.series)
+    assert ts2.series_original.equals(ts.series_original)
+    assert ts2.series_original.index.name == ts.series_original.index.name
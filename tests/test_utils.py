@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import pastas as ps
+from pastas.utils import convolve, get_convolution_method, \
+    datetime2matlab, matlab2datetime, ymd2datetime
+
+
+def test_convolve_methods():
+    rng = np.random.RandomState(0)
+    x = rng.rand(5000)
+    b = ps.Exponential().block([1.0, 50.0])
+    h = np.convolve(x, b)[:x.size]
+    for method in ["direct", "fft", "overlap", "recursive", "auto"]:
+        assert np.allclose(convolve(x, b, method=method), h)
+
+
+def test_get_convolution_method():
+    x = np.ones(10000)
+    assert get_convolution_method(x, np.ones(10)) == "direct"
+    assert get_convolution_method(x, ps.Exponential().block([1.0, 500.0])) \
+        == "recursive"
+    assert get_convolution_method(x, ps.Gamma().block([1.0, 2.0, 500.0])) \
+        == "fft"
+    assert get_convolution_method(np.ones(1000000),
+                                  ps.Gamma().block([1.0, 2.0, 500.0])) \
+        == "overlap"
+
+
+def test_matlab_datetime():
+    index = pd.date_range("1980-01-01 06:00", periods=1000, freq="7H")
+    datenums = datetime2matlab(index)
+    assert datetime2matlab(pd.Timestamp("2000-01-01 12:00")) == 730486.5
+    assert np.allclose(datenums[[0, 1]], [723181.25, 723181.541666667])
+    assert matlab2datetime(datenums).round("s").equals(index)
+    assert matlab2datetime(730486.5) == pd.Timestamp("2000-01-01 12:00")
+
+
+def test_ymd2datetime():
+    index = pd.date_range("1899-12-25", periods=1000, freq="11D")
+    assert ymd2datetime(index.year, index.month, index.day).equals(index)
+    with pytest.raises(ValueError):
+        ymd2datetime([2001], [2], [29])